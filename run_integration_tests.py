@@ -57,7 +57,8 @@ def run_tests():
         sys.executable, "-m", "pytest",
         "tests/integration/test_container_start_endpoints.py",
         "-v",  # verbose output
-        "-s",  # don't capture print statements
+        "-n", "auto",  # spread tests across workers (pytest-xdist); logs show on failure
+        "--dist=loadscope",  # keep each module/class on one worker so its fixtures are set up once
         "--tb=short",  # shorter traceback format
         "-x",  # stop on first failure
         "--color=yes"
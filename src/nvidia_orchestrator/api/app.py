@@ -9,8 +9,9 @@ from typing import Any, Dict, List, Literal, Optional
 
 import httpx
 import requests
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 
 try:
@@ -18,9 +19,9 @@ try:
 except ImportError:
     psutil = None
 
-from nvidia_orchestrator.core.container_manager import ContainerManager
+from nvidia_orchestrator.core.container_manager import ContainerManager, DockerUnavailableError
 from nvidia_orchestrator.storage.postgres_store import PostgresStore
-from nvidia_orchestrator.utils.logger import logger
+from nvidia_orchestrator.utils.logger import configure_logging, logger
 
 app = FastAPI(title="Team 3 Orchestrator API", version="1.0.0")
 
@@ -38,6 +39,11 @@ async def global_exception_handler(request, exc):
     logger.error(f"Unhandled exception: {exc}", exc_info=True)
     return {"error": "Internal server error", "detail": str(exc)}, 500
 
+@app.exception_handler(DockerUnavailableError)
+async def docker_unavailable_handler(request: Request, exc: DockerUnavailableError) -> JSONResponse:
+    logger.warning(f"Docker unavailable: {exc}")
+    return JSONResponse(status_code=503, content={"detail": str(exc)})
+
 manager = ContainerManager()
 
 ## this section for service
@@ -249,6 +255,16 @@ HEALTH_PATH   = os.getenv("HEALTH_PATH", "http://localhost:8000/health")
 def _health_url() -> str:
     return f"http://{PUBLIC_HOST}:{PUBLIC_PORT}{HEALTH_PATH}"
 
+@app.on_event("startup")
+async def setup_logging() -> None:
+    """Configure logging when the app is served directly (e.g. `uvicorn nvidia_orchestrator.api.app:app`)"""
+    configure_logging()
+
+@app.on_event("startup")
+async def build_openapi_schema() -> None:
+    """Generate and cache the OpenAPI schema now instead of on the first /docs or /openapi.json hit"""
+    app.openapi()
+
 # --- רישום אוטומטי בעת עליית השרת ---
 REGISTRY_URL = os.getenv("REGISTRY_URL")
 REGISTRY_API_KEY = os.getenv("REGISTRY_API_KEY")
@@ -271,7 +287,7 @@ async def do_register():
 
     # Build the health URL for registration
     health_url = f"http://{PUBLIC_HOST}:{PUBLIC_PORT}{HEALTH_PATH}"
-    
+
     payload = {
         "id": "orchestrator-1",
         "kind": "orchestrator",
@@ -284,7 +300,7 @@ async def do_register():
 
     # Use the correct endpoint: /registry/parts
     registry_endpoint = f"{REGISTRY_URL.rstrip('/')}/registry/parts"
-    
+
     for i in range(5):
         try:
             r = httpx.post(registry_endpoint, json=payload, headers=headers, timeout=5)
@@ -630,6 +646,8 @@ def start_container(body: StartBody):
             "ports": {},
             "desired_state_saved": True  # Add this line
         }
+    except DockerUnavailableError:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -637,13 +655,14 @@ def start_container(body: StartBody):
 def get_all_containers():
     """Returns all managed containers with status + host port bindings"""
     try:
-        # Get all containers managed by this orchestrator
-        all_containers = manager.list_managed_containers()
+        # Get all containers managed by this orchestrator; while Docker is down
+        # this is the last known listing, with every entry marked stale
+        all_containers = manager.list_managed_containers(allow_stale=True)
 
         # Format response for other teams
         formatted_containers = []
         for container in all_containers:
-            formatted_containers.append({
+            entry = {
                 "id": container.get("id"),
                 "name": container.get("name"),
                 "image": container.get("image"),
@@ -651,9 +670,14 @@ def get_all_containers():
                 "ports": container.get("host_ports", {}),
                 "created_at": container.get("created_at"),
                 "resources": container.get("resources", {})
-            })
+            }
+            if container.get("stale"):
+                entry["stale"] = True
+            formatted_containers.append(entry)
 
         return {"containers": formatted_containers, "total": len(formatted_containers)}
+    except DockerUnavailableError:
+        raise
     except Exception as e:
         logger.error(f"Failed to get all containers: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to retrieve containers: {str(e)}")
@@ -732,8 +756,8 @@ def instance_health(instanceId: str):
 
         return body
 
-    except HTTPException:
-        # Re-raise HTTP exceptions as-is
+    except (HTTPException, DockerUnavailableError):
+        # Re-raise HTTP exceptions as-is; Docker outages map to 503
         raise
     except Exception as e:
         # Catch any unexpected errors and return a 500
@@ -776,6 +800,8 @@ def start_image(imageId: str, body: StartBody):
             try:
                 info = manager.create_container(imageId, env=body.env, ports=ports, resources=resources)
                 started_ids.append(info["id"])
+            except DockerUnavailableError:
+                raise
             except Exception as e:
                 failed_count += 1
                 # Log the failure but continue with other containers
@@ -791,7 +817,7 @@ def start_image(imageId: str, body: StartBody):
 
         return {"started": started_ids}
 
-    except HTTPException:
+    except (HTTPException, DockerUnavailableError):
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to start containers for image {imageId}: {str(e)}")
@@ -821,6 +847,8 @@ def delete_container_by_id(idOrName: str, force: bool = Query(False, description
                 raise HTTPException(status_code=404, detail=f"Container '{idOrName}' not found")
             raise HTTPException(status_code=400, detail=res.get("error", "failed"))
         return {"deleted": True, "container_id": idOrName, "name": idOrName}
+    except DockerUnavailableError:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -949,6 +977,7 @@ def set_endpoint_status(endpoint_id: str, status: StatusEnum):
 def run_server() -> None:
     """Run the API server."""
     import uvicorn
+    configure_logging()
     uvicorn.run("nvidia_orchestrator.api.app:app", host="0.0.0.0", port=8000, reload=True)
 
 if __name__ == "__main__":
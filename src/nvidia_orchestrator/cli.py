@@ -12,7 +12,8 @@ import uvicorn
 from nvidia_orchestrator import __version__
 from nvidia_orchestrator.api.app import app
 from nvidia_orchestrator.main import run
-from nvidia_orchestrator.monitoring.health_monitor import run_forever
+from nvidia_orchestrator.monitoring.health_monitor import run_sharded
+from nvidia_orchestrator.utils.logger import configure_logging
 
 
 def main(argv: Optional[List[str]] = None) -> int:
@@ -88,6 +89,7 @@ def main(argv: Optional[List[str]] = None) -> int:
     )
 
     args = parser.parse_args(argv)
+    configure_logging()
 
     if args.command == "server":
         # Run full server (API + monitor)
@@ -102,7 +104,7 @@ def main(argv: Optional[List[str]] = None) -> int:
     elif args.command == "monitor":
         # Run monitor only
         os.environ["HEALTH_INTERVAL_SECONDS"] = str(args.interval)
-        run_forever()
+        run_sharded()
         return 0
 
     elif args.command == "version":
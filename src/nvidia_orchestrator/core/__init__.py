@@ -6,6 +6,6 @@ This module contains the core container management logic.
 
 from __future__ import annotations
 
-from nvidia_orchestrator.core.container_manager import ContainerManager
+from nvidia_orchestrator.core.container_manager import ContainerManager, DockerUnavailableError
 
-__all__ = ["ContainerManager"]
+__all__ = ["ContainerManager", "DockerUnavailableError"]
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import functools
+import random
 import socket
+import threading
 import time
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, cast
 
 import docker
-from docker.errors import APIError, NotFound
+from docker.errors import APIError, DockerException, NotFound
 from docker.models.containers import Container
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import RequestException
 
 from nvidia_orchestrator.storage.postgres_store import PostgresStore
 from nvidia_orchestrator.utils.logger import logger
@@ -72,12 +78,63 @@ def _normalize_run_resources(resources: Optional[Dict[str, Any]]) -> Dict[str, A
     return {k: v for k, v in out.items() if v is not None}
 
 
+class DockerUnavailableError(RuntimeError):
+    """Raised when the Docker daemon can't be reached (including during the reconnect cooldown)."""
+
+
+def _docker_unreachable(error: BaseException) -> bool:
+    """True for failures reaching the daemon itself, as opposed to API errors it returned."""
+    return isinstance(error, RequestsConnectionError) or \
+        (isinstance(error, DockerException) and not isinstance(error, APIError))
+
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def _docker_call(method: _F) -> _F:
+    """Wrap a ContainerManager method that talks to the daemon.
+
+    Checks for a client up front without a ping round-trip; a connection failure
+    during the call drops the client (so a later call reconnects) and surfaces as
+    DockerUnavailableError.
+    """
+    @functools.wraps(method)
+    def wrapper(self: ContainerManager, *args: Any, **kwargs: Any) -> Any:
+        client = self._require_docker_client()
+        try:
+            return method(self, *args, **kwargs)
+        except Exception as e:
+            if not _docker_unreachable(e):
+                raise
+            self._drop_docker_client(client, e)
+            raise DockerUnavailableError(f"Docker daemon is unreachable: {e}") from e
+    return cast(_F, wrapper)
+
+
 class ContainerManager:
     LABEL_KEY = "managed-by"
+    # Docker list filter matching every container this service manages
+    LABEL_FILTER: Dict[str, List[str]] = {"label": [LABEL_KEY]}
+    # After a hard Docker failure, skip reconnect attempts for this long
+    RECONNECT_COOLDOWN_SEC = 5.0
+    # Keep-alive connections kept per Docker daemon; sized for the health
+    # monitor's concurrent stats calls and streams (docker-py default is 10)
+    DOCKER_MAX_POOL_SIZE = 32
+    # How long a new container gets to crash on startup before it counts as running
+    START_SETTLE_SEC = 0.5
+    # Most (image, resources) runner configs kept; least recently used are evicted
+    RUNNER_CACHE_SIZE = 128
 
     def __init__(self) -> None:
         logger.info("Initializing ContainerManager")
-        self.client = None
+        # docker.DockerClient, or None while Docker is unreachable
+        self.client: Any = None
+        self._client_lock = threading.Lock()
+        self._last_failure_ts = 0.0
+        self._last_managed: Optional[List[Dict[str, Any]]] = None
+        # LRU of (pre-bound containers.run, detected image ports), keyed by _runner_key().
+        # Guarded by _client_lock; replaced wholesale on reconnect
+        self._runner_cache: OrderedDict[Tuple[Any, ...], Tuple[Callable[..., Container], Optional[Dict[str, Optional[int]]]]] = OrderedDict()
         self._init_docker_client()
 
         self._store = PostgresStore()  # enabled=False if not reachable
@@ -90,38 +147,76 @@ class ContainerManager:
         """Initialize Docker client with retry logic. Non-fatal on failure."""
         for attempt in range(max_retries):
             try:
-                self.client = docker.from_env()
-                self.client.ping()  # Test connection
+                client = docker.from_env(max_pool_size=self.DOCKER_MAX_POOL_SIZE)
+                client.ping()  # Test connection
+                self.client = client
+                # Cached runners are bound to the old client. Callers hold _client_lock
+                # (or are __init__); a lookup in flight keeps writing to the old dict
+                self._runner_cache = OrderedDict()
+                self._last_failure_ts = 0.0
                 logger.info("Docker client initialized successfully")
                 return
             except Exception as e:
                 logger.warning(f"Docker client initialization attempt {attempt + 1}/{max_retries} failed: {e}")
                 if attempt < max_retries - 1:
-                    import time
-                    time.sleep(2 ** attempt)  # Exponential backoff
+                    # Exponential backoff with jitter so concurrent callers don't retry in lockstep
+                    time.sleep((2 ** attempt) * (0.5 + random.random() * 0.5))
                 else:
                     logger.error(f"Failed to initialize Docker client after {max_retries} attempts: {e}")
                     # Leave self.client as None; defer errors to call sites
                     self.client = None
+                    self._last_failure_ts = time.monotonic()
                     return
 
-    def _ensure_docker_client(self) -> None:
-        """Ensure Docker client is available, reinitialize if needed"""
-        if self.client is None:
-            logger.warning("Docker client is None, attempting to reinitialize...")
+    def _docker_circuit_open(self) -> bool:
+        """True while we are inside the cooldown window after a hard failure."""
+        return bool(self._last_failure_ts) and \
+            time.monotonic() - self._last_failure_ts < self.RECONNECT_COOLDOWN_SEC
+
+    def _ensure_docker_client(self) -> bool:
+        """Ensure Docker client is available, reinitialize if needed.
+
+        Returns False when Docker is unreachable. A client is kept until a call
+        on it fails to connect (see _docker_call), so this doesn't ping. Only one
+        thread reconnects at a time, and reconnects are skipped entirely during
+        the cooldown window.
+        """
+        if self.client is not None:
+            return True
+
+        if self._docker_circuit_open():
+            logger.debug("Docker reconnect skipped (cooldown after recent failure)")
+            return False
+
+        with self._client_lock:
+            # Another thread may have reconnected (or failed) while we waited
+            if self.client is not None:
+                return True
+            if self._docker_circuit_open():
+                return False
+            logger.warning("Docker client unavailable, attempting to reinitialize...")
             self._init_docker_client()
-
+        return self.client is not None
+
+    def _require_docker_client(self) -> docker.DockerClient:
+        """Return the Docker client, or raise DockerUnavailableError if there is none."""
+        if not self._ensure_docker_client() or self.client is None:
+            raise DockerUnavailableError("Docker daemon is unreachable")
+        return self.client
+
+    def _drop_docker_client(self, client: docker.DockerClient, error: BaseException) -> None:
+        """Forget a client whose daemon stopped answering and start the reconnect cooldown."""
+        with self._client_lock:
+            # Another thread may already have replaced it
+            if self.client is not client:
+                return
+            logger.error(f"Docker client connection lost: {error}")
+            self.client = None
+            self._last_failure_ts = time.monotonic()
         try:
-            self.client.ping()
-        except Exception as e:
-            logger.error(f"Docker client connection lost: {e}")
-            self._init_docker_client()
-
-        self._store = PostgresStore()  # enabled=False if not reachable
-        if self._store.enabled:
-            logger.info("PostgreSQL store enabled")
-        else:
-            logger.warning("PostgreSQL store disabled - events will not be persisted")
+            client.close()
+        except Exception:
+            pass
 
 
     # --- event helper ---
@@ -143,16 +238,11 @@ class ContainerManager:
         return fixed
 
     def _find_by_label_value(self, value: str) -> List[Container]:
-        items = self.client.containers.list(all=True, filters={"label": [self.LABEL_KEY]})
-        out: List[Container] = []
-        for c in items:
-            try:
-                labels = c.labels or {}
-                if labels.get(self.LABEL_KEY) == value:
-                    out.append(c)
-            except Exception:
-                continue
-        return out
+        # Match key=value in the daemon: containers.list inspects every entry it
+        # returns, so filtering client-side paid an inspect per unrelated container
+        containers: List[Container] = self.client.containers.list(
+            all=True, filters={"label": [f"{self.LABEL_KEY}={value}"]})
+        return containers
 
     def _get_by_name_or_id(self, name_or_id: str) -> Container:
         try:
@@ -203,7 +293,8 @@ class ContainerManager:
 
     @staticmethod
     def _summarize_container(c: Container) -> Dict[str, Any]:
-        c.reload()
+        # Callers pass containers from containers.get/list (both a full inspect) or
+        # just reloaded, so attrs are already fresh; no second inspect round-trip
         attrs = c.attrs or {}
         net = attrs.get("NetworkSettings", {}) or {}
         ports_raw = net.get("Ports", {}) or {}
@@ -239,6 +330,7 @@ class ContainerManager:
             "resources": {k: v for k, v in res.items() if v is not None},
         }
 
+    @_docker_call
     def _run_new_container(
         self,
         image: str,
@@ -250,9 +342,6 @@ class ContainerManager:
         logger.info(f"Creating new container for image: {image}")
         logger.debug(f"Container config - env: {env}, ports: {ports}, resources: {resources}")
 
-        # Ensure Docker client is available
-        self._ensure_docker_client()
-
         # Validate image exists or can be pulled
         try:
             self.client.images.get(image)
@@ -263,31 +352,22 @@ class ContainerManager:
                 self.client.images.pull(image)
                 logger.info(f"Successfully pulled image {image}")
             except Exception as e:
+                if _docker_unreachable(e):
+                    raise
                 logger.error(f"Failed to pull image {image}: {e}")
                 raise RuntimeError(f"Image {image} not available and cannot be pulled: {e}")
 
-        port_map = self._normalize_ports(ports)
-        if not port_map:
-            port_map = self._detect_exposed_ports(image)
-            logger.debug(f"Detected exposed ports: {port_map}")
-
-        run_kwargs = _normalize_run_resources(resources)
-        logger.debug(f"Run kwargs: {run_kwargs}")
+        runner = self._get_runner(image, env=env, ports=ports, resources=resources)
 
         try:
-            container = self.client.containers.run(
-                image=image,
-                detach=True,
-                environment=env or None,
-                ports=port_map or None,
-                labels={self.LABEL_KEY: image},
-                restart_policy={"Name": "unless-stopped"},
-                **run_kwargs,
-            )
+            container = runner()
             logger.info(f"Container created: {container.id} ({container.name})")
 
-            # Wait a bit for container to stabilize
-            time.sleep(0.5)
+            # Wait a bit for container to stabilize; returns as soon as it exits
+            try:
+                self.client.api.wait(container.id, timeout=self.START_SETTLE_SEC, condition="not-running")
+            except RequestException:
+                pass  # still running once the settle window is over
 
             # Verify container is actually running
             container.reload()
@@ -327,8 +407,72 @@ class ContainerManager:
                 pass
             raise
 
+    @staticmethod
+    def _runner_key(image: str, resources: Optional[Dict[str, Any]]) -> Tuple[Any, ...]:
+        return (image, tuple(sorted((resources or {}).items())))
+
+    def _get_runner(
+        self,
+        image: str,
+        *,
+        env: Optional[Dict[str, str]] = None,
+        ports: Optional[Dict[str, Optional[int]]] = None,
+        resources: Optional[Dict[str, Any]] = None,
+    ) -> Callable[[], Container]:
+        """Return a containers.run partial for this config.
+
+        The per-image part (resource normalization, exposed-port detection) is
+        cached per (image, resources), so repeated scale-ups skip it; env and
+        ports are bound per call. Entries are dropped on reconnect and on
+        resource updates.
+        """
+        key: Optional[Tuple[Any, ...]]
+        with self._client_lock:
+            cache = self._runner_cache
+            try:
+                key = self._runner_key(image, resources)
+                cached = cache.get(key)
+            except TypeError:  # unhashable values; build without caching
+                key, cached = None, None
+
+        if cached is not None:
+            base, exposed = cached
+        else:
+            run_kwargs = _normalize_run_resources(resources)
+            logger.debug(f"Run kwargs: {run_kwargs}")
+            base = functools.partial(
+                self.client.containers.run,
+                image=image,
+                detach=True,
+                labels={self.LABEL_KEY: image},
+                restart_policy={"Name": "unless-stopped"},
+                **run_kwargs,
+            )
+            exposed = None
+
+        port_map = self._normalize_ports(ports)
+        if not port_map:
+            if exposed is None:
+                exposed = self._detect_exposed_ports(image)
+                logger.debug(f"Detected exposed ports: {exposed}")
+            port_map = exposed
+
+        if key is not None:
+            with self._client_lock:
+                cache[key] = (base, exposed)
+                cache.move_to_end(key)
+                while len(cache) > self.RUNNER_CACHE_SIZE:
+                    cache.popitem(last=False)
+
+        return functools.partial(
+            base,
+            environment=dict(env) if env else None,
+            ports=port_map or None,
+        )
+
     # -------- public API --------
 
+    @_docker_call
     def ensure_singleton_for_image(
         self,
         image: str,
@@ -353,26 +497,45 @@ class ContainerManager:
     ) -> Dict[str, Any]:
         return self._run_new_container(image, env=env, ports=ports, resources=resources)
 
-    def list_managed_containers(self) -> List[Dict[str, Any]]:
-        self._ensure_docker_client()
-        items = self.client.containers.list(all=True, filters={"label": [self.LABEL_KEY]})
+    def list_managed_containers(self, *, allow_stale: bool = False) -> List[Dict[str, Any]]:
+        """Summaries of every managed container.
+
+        Raises DockerUnavailableError when Docker is unreachable, unless
+        allow_stale is set and a previous listing exists; that listing is then
+        returned with every entry marked stale=True.
+        """
+        try:
+            self._last_managed = self._list_managed()
+        except DockerUnavailableError:
+            if not allow_stale or self._last_managed is None:
+                raise
+            return [dict(s, stale=True) for s in self._last_managed]
+        # Copy each entry so callers can't mutate the cached inventory
+        return [dict(s) for s in self._last_managed]
+
+    @_docker_call
+    def _list_managed(self) -> List[Dict[str, Any]]:
+        items = self.client.containers.list(all=True, filters=self.LABEL_FILTER)
         return [self._summarize_container(c) for c in items]
 
+    @_docker_call
     def list_instances_for_image(self, image: str) -> List[Dict[str, Any]]:
-        self._ensure_docker_client()
         return [self._summarize_container(c) for c in self._find_by_label_value(image)]
 
+    @_docker_call
     def list_instances_by_image_name(self, image_name: str) -> List[Dict[str, Any]]:
         """Find instances by Docker image name instead of label value"""
-        self._ensure_docker_client()
         try:
             # Use Docker's ancestor filter to find containers by image name
             containers = self.client.containers.list(all=True, filters={"ancestor": image_name})
             return [self._summarize_container(c) for c in containers]
         except Exception as e:
+            if _docker_unreachable(e):
+                raise
             logger.error(f"Error finding containers by image name {image_name}: {e}")
             return []
 
+    @_docker_call
     def delete_container(self, name_or_id: str, *, force: bool = False) -> Dict[str, Any]:
         logger.info(f"Deleting container: {name_or_id} (force: {force})")
         try:
@@ -398,9 +561,12 @@ class ContainerManager:
             logger.error(f"API error deleting container {name_or_id}: {e}")
             return {"ok": False, "error": str(e)}
         except Exception as e:
+            if _docker_unreachable(e):
+                raise
             logger.error(f"Unexpected error deleting container {name_or_id}: {e}")
             return {"ok": False, "error": str(e)}
 
+    @_docker_call
     def stop_container(self, name_or_id: str, timeout: int = 10) -> Dict[str, Any]:
         logger.info(f"Stopping container: {name_or_id} (timeout: {timeout}s)")
         try:
@@ -426,9 +592,12 @@ class ContainerManager:
             logger.error(f"API error stopping container {name_or_id}: {e}")
             return {"ok": False, "error": str(e)}
         except Exception as e:
+            if _docker_unreachable(e):
+                raise
             logger.error(f"Unexpected error stopping container {name_or_id}: {e}")
             return {"ok": False, "error": str(e)}
 
+    @_docker_call
     def start_container(self, name_or_id: str) -> Dict[str, Any]:
         try:
             c = self._get_by_name_or_id(name_or_id)
@@ -447,6 +616,7 @@ class ContainerManager:
         except APIError as e:
             return {"ok": False, "error": str(e)}
 
+    @_docker_call
     def container_stats(self, name_or_id: str) -> Dict[str, Any]:
         try:
             c = self._get_by_name_or_id(name_or_id)
@@ -480,12 +650,13 @@ class ContainerManager:
                 "env": env or {},
                 "ports": ports or {},
             }
-            self._store.upsert_desired(image, doc)
-            logger.info(f"Desired state persisted for {image}")
+            self._store.upsert_desired_async(image, doc)
+            logger.info(f"Desired state queued for {image}")
 
         # Ensure we have the right number of running containers
         current_instances = self.list_instances_for_image(image)
-        running_count = len([i for i in current_instances if i.get("state") == "running"])
+        running_instances = [i for i in current_instances if i.get("state") == "running"]
+        running_count = len(running_instances)
 
         if running_count < min_replicas:
             # Start more containers
@@ -501,7 +672,6 @@ class ContainerManager:
             # Stop excess containers
             excess = running_count - max_replicas
             logger.info(f"Stopping {excess} excess containers for {image}")
-            running_instances = [i for i in current_instances if i.get("state") == "running"]
             for i in range(excess):
                 try:
                     self.stop_container(running_instances[i]["id"])
@@ -512,10 +682,11 @@ class ContainerManager:
             "image": image,
             "min_replicas": min_replicas,
             "max_replicas": max_replicas,
-            "current_running": len([i for i in current_instances if i.get("state") == "running"]),
+            "current_running": running_count,
             "total_instances": len(current_instances)
         }
 
+    @_docker_call
     def update_resources_for_image(
         self,
         image: str,
@@ -523,6 +694,9 @@ class ContainerManager:
         cpu_limit: Optional[str] = None,
         memory_limit: Optional[str] = None
     ) -> List[str]:
+        with self._client_lock:
+            for key in [k for k in self._runner_cache if k[0] == image]:
+                del self._runner_cache[key]
         updated: List[str] = []
         for c in self._find_by_label_value(image):
             params: Dict[str, Any] = {}
@@ -536,16 +710,16 @@ class ContainerManager:
                 try:
                     c.update(**params)
                     updated.append(c.id)
-                except Exception:
+                except Exception as e:
+                    if _docker_unreachable(e):
+                        raise
                     continue
         return updated
 
     def get_system_resource_usage(self) -> Dict[str, Any]:
         """Get current Docker container resource usage across all managed containers"""
         try:
-            self._ensure_docker_client()
-
-            # Get all managed containers
+            # Get all managed containers (raises while Docker is unreachable)
             containers = self.list_managed_containers()
 
             total_cpu_percent = 0.0
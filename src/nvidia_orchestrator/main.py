@@ -16,16 +16,16 @@ import uvicorn
 from nvidia_orchestrator.api.app import app
 from nvidia_orchestrator.core.container_manager import ContainerManager
 from nvidia_orchestrator.monitoring.health_monitor import (
-    run_forever,
+    run_sharded,
     sample_once,
 )
 from nvidia_orchestrator.storage.postgres_store import PostgresStore
-from nvidia_orchestrator.utils.logger import logger
+from nvidia_orchestrator.utils.logger import configure_logging, logger
 
 
 def run_api_server() -> None:
     """Run the API server in a separate process."""
-
+    configure_logging()
     logger.info("Starting API server on port 8000...")
     uvicorn.run(
         app,
@@ -38,8 +38,9 @@ def run_api_server() -> None:
 
 def run_health_monitor() -> None:
     """Run the health monitor in a separate process."""
+    configure_logging()
     logger.info("Starting health monitor...")
-    run_forever()
+    run_sharded()
 
 
 def run() -> None:
@@ -49,7 +50,7 @@ def run() -> None:
     This function starts both components in separate processes and handles
     graceful shutdown on SIGINT/SIGTERM.
     """
-
+    configure_logging()
     logger.info("Starting NVIDIA Orchestrator...")
 
     # Create processes for API and monitor
@@ -106,6 +107,7 @@ async def run_async() -> None:
     This is an alternative implementation using asyncio for environments
     that prefer async/await patterns.
     """
+    configure_logging()
     logger.info("Starting NVIDIA Orchestrator (async mode)...")
 
     # Create tasks for both components
@@ -127,7 +129,7 @@ async def run_async() -> None:
 
         while True:
             try:
-                sample_once(manager, store)
+                await sample_once(manager, store)
                 await asyncio.sleep(60)  # Default interval
             except Exception as e:
                 logger.error(f"Health monitor error: {e}")
@@ -6,6 +6,6 @@ This module provides health monitoring and metrics collection for containers.
 
 from __future__ import annotations
 
-from nvidia_orchestrator.monitoring.health_monitor import run_forever, sample_once
+from nvidia_orchestrator.monitoring.health_monitor import run_forever, run_sharded, sample_once
 
-__all__ = ["run_forever", "sample_once"]
+__all__ = ["run_forever", "run_sharded", "sample_once"]
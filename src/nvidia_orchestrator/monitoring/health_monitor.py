@@ -1,45 +1,90 @@
 from __future__ import annotations
 
+import asyncio
+import functools
+import multiprocessing
 import os
-import shutil
+import signal
 import socket
+import threading
 import time
-from typing import Any, Dict, List, Optional
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, cast
 
 import httpx
 
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore[assignment]
+
 from nvidia_orchestrator.core.container_manager import ContainerManager
 from nvidia_orchestrator.storage.postgres_store import PostgresStore
-from nvidia_orchestrator.utils.logger import logger
+from nvidia_orchestrator.utils.logger import configure_logging, logger, shutdown_logging
 
 INTERVAL_SEC = int(os.getenv("HEALTH_INTERVAL_SECONDS", "60"))
 RETENTION_DAYS = int(os.getenv("HEALTH_RETENTION_DAYS", "7"))
+PRUNE_INTERVAL_SEC = int(os.getenv("HEALTH_PRUNE_INTERVAL_SECONDS", "3600"))
+STATS_MAX_WORKERS = 32
+# Unchanged containers get a snapshot row at least this often
+HEARTBEAT_SEC = int(os.getenv("HEALTH_HEARTBEAT_SECONDS", "600"))
+# CPU/memory changes smaller than this bucket don't count as a change
+USAGE_BIN_PCT = 5.0
+DISK_REFRESH_SEC = 300
+# Number of monitor worker processes; containers are split between them by id
+MONITOR_SHARDS = int(os.getenv("HEALTH_MONITOR_SHARDS", "1"))
+
+# Hostname is constant for the lifetime of the process
+_HOST = socket.gethostname()
+
+# Set on SIGTERM (or via stop()) to end run_forever without waiting out the interval
+_stop = threading.Event()
 
 class ContainerStateTracker:
     """Real-time tracking of container states in memory"""
 
-    def __init__(self):
-        self._states_in_memory = {}  # {container_id: state}
+    def __init__(self) -> None:
+        # {container_id: {state, status, cpu_bin, mem_bin, last_written_at}}
+        self._states_in_memory: Dict[str, Dict[str, Any]] = {}
 
     def get_previous_state(self, container_id: str) -> Optional[str]:
         """Get the previous state of a container"""
-        return self._states_in_memory.get(container_id)
+        return (self._states_in_memory.get(container_id) or {}).get("state")
 
-    def update_state(self, container_id: str, new_state: str):
+    def update_state(self, container_id: str, new_state: str) -> Optional[str]:
         """Update the state of a container"""
-        old_state = self._states_in_memory.get(container_id)
-        self._states_in_memory[container_id] = new_state
+        entry = self._states_in_memory.setdefault(container_id, {})
+        old_state = entry.get("state")
+        entry["state"] = new_state
         return old_state
 
-    def cleanup_removed_containers(self, current_container_ids: List[str]):
+    @staticmethod
+    def _bin(value: float) -> int:
+        """Bucket a usage percentage to the nearest USAGE_BIN_PCT"""
+        return int(round(value / USAGE_BIN_PCT))
+
+    def needs_snapshot(self, container_id: str, status: str, cpu: float, mem: float, now: float) -> bool:
+        """True unless the last written sample looks the same and is younger than HEARTBEAT_SEC"""
+        entry = self._states_in_memory.get(container_id) or {}
+        last = entry.get("last_written_at")
+        if last is None or now - last >= HEARTBEAT_SEC:
+            return True
+        return (entry.get("status"), entry.get("cpu_bin"), entry.get("mem_bin")) != \
+            (status, self._bin(cpu), self._bin(mem))
+
+    def mark_written(self, container_id: str, status: str, cpu: float, mem: float, now: float) -> None:
+        """Remember what was last written for a container"""
+        entry = self._states_in_memory.setdefault(container_id, {})
+        entry.update(status=status, cpu_bin=self._bin(cpu), mem_bin=self._bin(mem), last_written_at=now)
+
+    def cleanup_removed_containers(self, current_container_ids: Set[str]) -> None:
         """Clean up deleted containers from memory"""
-        current_ids = set(current_container_ids)
-        stored_ids = set(self._states_in_memory.keys())
-        removed_ids = stored_ids - current_ids
+        removed_ids = self._states_in_memory.keys() - current_container_ids
 
         for removed_id in removed_ids:
             del self._states_in_memory[removed_id]
-            logger.debug(f"Removed state tracking for deleted container: {removed_id}")
+            logger.debug("Removed state tracking for deleted container: %s", removed_id)
 
 # Global state tracker instance
 _state_tracker = None
@@ -51,15 +96,167 @@ def get_state_tracker() -> ContainerStateTracker:
         _state_tracker = ContainerStateTracker()
     return _state_tracker
 
-def _get_container_port(container_info: dict) -> int:
-    """Extract container port"""
-    host_ports = container_info.get("host_ports", {})
-    for _, port_info in host_ports.items():
-        if port_info and isinstance(port_info, list) and len(port_info) > 0:
-            return int(port_info[0].get("HostPort", 8000))
-    return 8000  # default fallback
+class StatsCache:
+    """Latest Docker stats sample per container, fed by streaming subscriptions"""
+
+    def __init__(self, manager: ContainerManager):
+        self._manager = manager
+        self._lock = threading.Lock()
+        self._latest: Dict[str, Dict[str, Any]] = {}
+        self._readers: Dict[str, threading.Event] = {}  # {container_id: stop flag}
+
+    def track(self, container_ids: Iterable[str]) -> None:
+        """Start a stats stream for every container not already being followed"""
+        with self._lock:
+            for cid in container_ids:
+                if cid in self._readers:
+                    continue
+                stop = threading.Event()
+                self._readers[cid] = stop
+                threading.Thread(
+                    target=self._read_stream, args=(cid, stop), name=f"stats-{cid[:12]}", daemon=True
+                ).start()
+
+    def get(self, container_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._latest.get(container_id)
+
+    def reap(self, keep_ids: Set[str]) -> None:
+        """Stop following containers that are no longer running"""
+        with self._lock:
+            for cid in [c for c in self._readers if c not in keep_ids]:
+                self._readers.pop(cid).set()
+                self._latest.pop(cid, None)
+                logger.debug("Stopped stats stream for container: %s", cid)
+
+    def _read_stream(self, cid: str, stop: threading.Event) -> None:
+        try:
+            client = self._manager.client
+            if client is None:
+                # Docker is unreachable; the next cycle's track() tries again
+                logger.debug("No Docker client, skipping stats stream for %s", cid)
+                return
+            for stats in client.api.stats(cid, stream=True, decode=True):
+                if stop.is_set():
+                    break
+                with self._lock:
+                    self._latest[cid] = stats
+        except Exception as e:
+            logger.debug("Stats stream for %s ended: %s", cid, e)
+        finally:
+            with self._lock:
+                # Let the next cycle restart the stream if it ended on its own
+                if self._readers.get(cid) is stop:
+                    del self._readers[cid]
+                    self._latest.pop(cid, None)
+
+# Global stats cache instance
+_stats_cache = None
+
+def get_stats_cache(manager: ContainerManager) -> StatsCache:
+    """Create Stats Cache (singleton pattern)"""
+    global _stats_cache
+    if _stats_cache is None:
+        _stats_cache = StatsCache(manager)
+    return _stats_cache
+
+class ContainerInventory:
+    """Managed-container inventory kept current from the Docker events stream"""
+
+    # Container actions after which we re-inspect the container
+    _REFRESH_ACTIONS = {"create", "start", "restart", "die", "stop", "kill", "pause", "unpause", "update"}
+
+    def __init__(self, manager: ContainerManager):
+        self._manager = manager
+        self._lock = threading.Lock()
+        self._containers: Dict[str, Dict[str, Any]] = {}
+        self._watcher: Optional[threading.Thread] = None
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Current managed containers; resyncs with a full listing if the event stream is down"""
+        if self._watcher is None or not self._watcher.is_alive():
+            self._resync()
+        with self._lock:
+            return list(self._containers.values())
+
+    def _resync(self) -> None:
+        # Subscribe from before the listing so no change can slip between the two
+        since = int(time.time())
+        listing = self._manager.list_managed_containers()
+        for summary in listing:
+            summary["_cached_port"] = _get_container_port(summary)
+        with self._lock:
+            self._containers = {s["id"]: s for s in listing}
+        self._watcher = threading.Thread(
+            target=self._watch, args=(since,), name="container-inventory", daemon=True
+        )
+        self._watcher.start()
+
+    def _watch(self, since: int) -> None:
+        client = self._manager.client
+        if client is None:
+            # Docker is unreachable; the next snapshot() resyncs (and reconnects)
+            logger.debug("No Docker client, not following container events")
+            return
+        try:
+            events = client.api.events(
+                since=since,
+                filters={"type": "container", "label": [ContainerManager.LABEL_KEY]},
+                decode=True,
+            )
+            for ev in events:
+                cid = ev.get("id")
+                action = (ev.get("Action") or ev.get("status") or "").split(":")[0]
+                if not cid:
+                    continue
+                if action == "destroy":
+                    with self._lock:
+                        self._containers.pop(cid, None)
+                elif action in self._REFRESH_ACTIONS:
+                    self._refresh(cid)
+        except Exception as e:
+            logger.warning("Docker events stream ended, inventory will resync: %s", e)
 
-def _get_container_caps(container_info: dict) -> dict:
+    def _refresh(self, cid: str) -> None:
+        client = self._manager.client
+        if client is None:
+            return
+        try:
+            summary = self._manager._summarize_container(client.containers.get(cid))
+        except Exception as e:
+            logger.debug("Could not inspect container %s after event: %s", cid, e)
+            return
+        summary["_cached_port"] = _get_container_port(summary)
+        with self._lock:
+            self._containers[cid] = summary
+
+# Global inventory instance
+_inventory = None
+
+def get_container_inventory(manager: ContainerManager) -> ContainerInventory:
+    """Create Container Inventory (singleton pattern)"""
+    global _inventory
+    if _inventory is None:
+        _inventory = ContainerInventory(manager)
+    return _inventory
+
+def _host_port(port_info: Any) -> Optional[int]:
+    """Host port from a summary entry: an int, or a raw Docker binding list"""
+    if isinstance(port_info, int):
+        return port_info
+    if port_info and isinstance(port_info, list) and port_info[0].get("HostPort"):
+        return int(port_info[0]["HostPort"])
+    return None
+
+def _get_container_port(container_info: Dict[str, Any]) -> int:
+    """Extract container port (cached on the inventory entry when available)"""
+    cached = container_info.get("_cached_port")
+    if cached is not None:
+        return int(cached)
+    host_ports = container_info.get("host_ports") or {}
+    return next((p for p in map(_host_port, host_ports.values()) if p is not None), 8000)
+
+def _get_container_caps(container_info: Dict[str, Any]) -> Dict[str, str]:
     """Extract container capabilities"""
     resources = container_info.get("resources", {})
     return {
@@ -67,38 +264,59 @@ def _get_container_caps(container_info: dict) -> dict:
         "mem": str(resources.get("memory_limit", "256m"))
     }
 
-def _cpu_percent(stats: Dict[str, Any]) -> Optional[float]:
+def _usage_fields(stats: Dict[str, Any]) -> Tuple[float, float, int, float, float]:
+    """Pull (cpu_delta, system_delta, ncpu, mem_usage, mem_limit) out of a Docker stats blob
+
+    CPU and memory are read separately, so a malformed section only zeroes its own fields.
+    """
     try:
         cpu = stats.get("cpu_stats", {}) or {}
         precpu = stats.get("precpu_stats", {}) or {}
-        cpu_total = (cpu.get("cpu_usage", {}) or {}).get("total_usage", 0) - \
-                    (precpu.get("cpu_usage", {}) or {}).get("total_usage", 0)
-        sys_total = (cpu.get("system_cpu_usage", 0) or 0) - (precpu.get("system_cpu_usage", 0) or 0)
-        ncpu = len((cpu.get("cpu_usage", {}) or {}).get("percpu_usage") or []) or 1
-        if sys_total > 0 and cpu_total >= 0:
-            return (cpu_total / sys_total) * ncpu * 100.0
+        cpu_usage = cpu.get("cpu_usage", {}) or {}
+        cpu_total = float(cpu_usage.get("total_usage", 0) - (precpu.get("cpu_usage", {}) or {}).get("total_usage", 0))
+        sys_total = float((cpu.get("system_cpu_usage", 0) or 0) - (precpu.get("system_cpu_usage", 0) or 0))
+        ncpu = len(cpu_usage.get("percpu_usage") or []) or 1
     except Exception:
-        pass
-    return None
-
-def _mem_percent(stats: Dict[str, Any]) -> Optional[float]:
+        cpu_total, sys_total, ncpu = 0.0, 0.0, 1
     try:
         mem = stats.get("memory_stats", {}) or {}
-        usage = float(mem.get("usage", 0.0))
-        limit = float(mem.get("limit") or 0.0)
-        if limit > 0:
-            return (usage / limit) * 100.0
+        mem_usage, mem_limit = float(mem.get("usage", 0.0)), float(mem.get("limit") or 0.0)
     except Exception:
-        pass
-    return None
+        mem_usage, mem_limit = 0.0, 0.0
+    return (cpu_total, sys_total, ncpu, mem_usage, mem_limit)
+
+def _usage_percents(stats_list: List[Dict[str, Any]]) -> Tuple[List[float], List[float]]:
+    """CPU and memory percentages for a batch of Docker stats blobs (0.0 when unknown)"""
+    if not stats_list:
+        return [], []
+    fields = [_usage_fields(stats) for stats in stats_list]
+    if np is not None:
+        cpu_total, sys_total, ncpu, mem_usage, mem_limit = np.array(fields, dtype=float).T
+        cpu_ok = (sys_total > 0) & (cpu_total >= 0)
+        cpu = np.divide(cpu_total * ncpu * 100.0, sys_total, out=np.zeros_like(cpu_total), where=cpu_ok)
+        mem = np.divide(mem_usage * 100.0, mem_limit, out=np.zeros_like(mem_usage), where=mem_limit > 0)
+        return cpu.tolist(), mem.tolist()
+    cpus = [(c / st) * n * 100.0 if st > 0 and c >= 0 else 0.0 for c, st, n, _, _ in fields]
+    mems = [(u / lim) * 100.0 if lim > 0 else 0.0 for _, _, _, u, lim in fields]
+    return cpus, mems
+
+# (monotonic timestamp, value) of the last disk usage reading
+_disk_cache: Tuple[float, Optional[float]] = (float("-inf"), None)
 
 def _disk_percent() -> Optional[float]:
+    """Root filesystem usage; disk fill changes slowly, so re-read at most every DISK_REFRESH_SEC"""
+    global _disk_cache
+    now = time.monotonic()
+    if now - _disk_cache[0] < DISK_REFRESH_SEC:
+        return _disk_cache[1]
     try:
-        du = shutil.disk_usage("/")
-        used = du.total - du.free
-        return (used / du.total) * 100.0 if du.total > 0 else None
+        st = os.statvfs("/")
+        # free = f_bavail (space usable by non-root), same as shutil.disk_usage
+        value = (1 - st.f_bavail / st.f_blocks) * 100.0 if st.f_blocks else None
     except Exception:
-        return None
+        value = None
+    _disk_cache = (now, value)
+    return value
 
 def _status(server_running: bool, cpu: Optional[float], mem: Optional[float]) -> str:
     if not server_running:
@@ -109,7 +327,53 @@ def _status(server_running: bool, cpu: Optional[float], mem: Optional[float]) ->
         return "warning"
     return "healthy"
 
-async def register_container_to_discovery(container_info: dict, registry_url: str, api_key: Optional[str] = None) -> bool:
+def _statuses(running: List[bool], cpu: List[float], mem: List[float]) -> List[str]:
+    """Vectorized _status over a batch of containers"""
+    if np is None or not running:
+        return [_status(r, c, m) for r, c, m in zip(running, cpu, mem)]
+    run_arr = np.asarray(running, dtype=bool)
+    peak = np.maximum(np.asarray(cpu, dtype=float), np.asarray(mem, dtype=float))
+    return cast(List[str], np.select(
+        [~run_arr, peak >= 95.0, peak >= 85.0],
+        ["stopped", "critical", "warning"],
+        default="healthy",
+    ).tolist())
+
+# Shared service-discovery client; reused so registrations keep warm connections
+_HTTPX_CLIENT: Optional[httpx.AsyncClient] = None
+_HTTPX_CLIENT_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared service-discovery client, creating it on first use.
+
+    httpx async connections belong to the event loop that opened them, so a
+    fresh client is built if we are called from a different loop.
+    """
+    global _HTTPX_CLIENT, _HTTPX_CLIENT_LOOP
+    loop = asyncio.get_running_loop()
+    if _HTTPX_CLIENT is None or _HTTPX_CLIENT.is_closed or _HTTPX_CLIENT_LOOP is not loop:
+        try:
+            import h2  # noqa: F401  (HTTP/2 needs the optional httpx[http2] extra)
+            http2 = True
+        except ImportError:
+            http2 = False
+        _HTTPX_CLIENT = httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=5.0,
+        )
+        _HTTPX_CLIENT_LOOP = loop
+    return _HTTPX_CLIENT
+
+async def aclose_client() -> None:
+    """Close the shared service-discovery client (call on shutdown)"""
+    global _HTTPX_CLIENT, _HTTPX_CLIENT_LOOP
+    if _HTTPX_CLIENT is not None:
+        await _HTTPX_CLIENT.aclose()
+        _HTTPX_CLIENT = None
+        _HTTPX_CLIENT_LOOP = None
+
+async def register_container_to_discovery(container_info: Dict[str, Any], registry_url: str, api_key: Optional[str] = None) -> bool:
     """Register container with service discovery system"""
     if not registry_url:
         return False
@@ -118,7 +382,7 @@ async def register_container_to_discovery(container_info: dict, registry_url: st
         container_id = container_info.get("id")
         container_name = container_info.get("name")
         image = container_info.get("image", "")
-        host = socket.gethostname()
+        host = _HOST
         port = _get_container_port(container_info)
         caps = _get_container_caps(container_info)
 
@@ -136,43 +400,78 @@ async def register_container_to_discovery(container_info: dict, registry_url: st
 
         # Use the correct endpoint: /registry/endpoints
         registry_endpoint = f"{registry_url.rstrip('/')}/registry/endpoints"
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.post(registry_endpoint, json=payload, headers=headers, timeout=5.0)
-            if response.status_code in (200, 201):
-                logger.info(f"Registered container {container_name} ({container_id}) to service discovery")
-                return True
-            else:
-                logger.warning(f"Failed to register container {container_name}: {response.status_code}")
-                return False
+
+        client = get_client()
+        response = await client.post(registry_endpoint, json=payload, headers=headers, timeout=5.0)
+        if response.status_code in (200, 201):
+            logger.info(f"Registered container {container_name} ({container_id}) to service discovery")
+            return True
+        else:
+            logger.warning(f"Failed to register container {container_name}: {response.status_code}")
+            return False
     except Exception as e:
         logger.error(f"Error registering container to service discovery: {e}")
         return False
 
-def sample_once(manager: ContainerManager, store: PostgresStore) -> None:
+# Worker threads for the blocking Docker SDK and psycopg calls made from sample_once
+_io_pool = ThreadPoolExecutor(max_workers=STATS_MAX_WORKERS, thread_name_prefix="health-io")
+
+async def _run_blocking(fn: Callable[..., Any], *args: Any) -> Any:
+    """Run a blocking call on the health monitor's I/O pool"""
+    return await asyncio.get_running_loop().run_in_executor(_io_pool, functools.partial(fn, *args))
+
+async def _fetch_stats(manager: ContainerManager, container_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Fetch Docker stats for several containers concurrently, keyed by container id"""
+    async def fetch(cid: str) -> Dict[str, Any]:
+        try:
+            result: Dict[str, Any] = await _run_blocking(manager.container_stats, cid)
+            return result
+        except Exception as e:
+            logger.error(f"Error getting stats for {cid}: {e}")
+            return {"ok": False, "error": str(e)}
+
+    results = await asyncio.gather(*(fetch(cid) for cid in container_ids))
+    return dict(zip(container_ids, results))
+
+def _in_shard(container_id: str, shard_id: int, num_shards: int) -> bool:
+    """Stable container -> shard assignment (built-in hash() differs per process)"""
+    return num_shards <= 1 or zlib.crc32(container_id.encode()) % num_shards == shard_id
+
+async def sample_once(
+    manager: ContainerManager, store: PostgresStore, shard_id: int = 0, num_shards: int = 1
+) -> None:
     if not store.enabled:
         logger.warning("PostgresStore disabled; skipping snapshot")
         return
 
     logger.debug("Starting health snapshot collection")
 
-    # Get state tracker
+    # Get state tracker and stats cache
     state_tracker = get_state_tracker()
-
-    # Get all containers managed by this orchestrator (label = managed-by)
-    instances: List[Dict[str, Any]] = manager.list_managed_containers()
-    host = socket.gethostname()
+    stats_cache = get_stats_cache(manager)
+
+    # Get all containers managed by this orchestrator (label = managed-by); the
+    # inventory follows Docker events, so this no longer re-lists every cycle
+    instances: List[Dict[str, Any]] = await _run_blocking(get_container_inventory(manager).snapshot)
+    if num_shards > 1:
+        instances = [s for s in instances if _in_shard(s.get("id") or "", shard_id, num_shards)]
+    host = _HOST
     disk = _disk_percent() or 0.0
 
     logger.info(f"Collecting health data for {len(instances)} containers on {host}")
 
-    current_container_ids = []
+    current_container_ids: Set[str] = set()
+    running_ids: List[str] = []
+    events: List[Dict[str, Any]] = []
+    snapshots: List[Dict[str, Any]] = []
     for s in instances:
-        cid = s.get("id")
-        current_container_ids.append(cid)
+        cid: str = s["id"]
+        current_container_ids.add(cid)
         name = s.get("name")
         image = s.get("image") or ""
         running = (s.get("state") == "running")
+        if running:
+            running_ids.append(cid)
 
         # Track state changes
         previous_state = state_tracker.get_previous_state(cid)
@@ -182,78 +481,165 @@ def sample_once(manager: ContainerManager, store: PostgresStore) -> None:
             logger.info(f"Container {name} ({cid}) state changed: {previous_state} -> {current_state}")
 
             # Record a compatible lifecycle event (schema allows: create/start/stop/remove)
-            try:
-                mapped_event = "start" if current_state == "running" else "stop"
-                store.record_event({
-                    "image": image,
-                    "container_id": cid,
-                    "name": name,
-                    "host": socket.gethostname(),
-                    "ports": {},
-                    "status": current_state,
-                    "event": mapped_event,
-                })
-            except Exception as e:
-                logger.error(f"Failed to record lifecycle event on state change: {e}")
-
-        logger.debug(f"Checking health for container {cid} ({name}) - running: {running}")
+            mapped_event = "start" if current_state == "running" else "stop"
+            events.append({
+                "image": image,
+                "container_id": cid,
+                "name": name,
+                "host": host,
+                "ports": {},
+                "status": current_state,
+                "event": mapped_event,
+            })
+
+    # Read the latest streamed sample; only containers without one yet (new
+    # streams, first cycle) fall back to concurrent one-shot stats calls
+    stats_cache.track(running_ids)
+    stats_results: Dict[str, Dict[str, Any]] = {}
+    missing: List[str] = []
+    for cid in running_ids:
+        cached = stats_cache.get(cid)
+        if cached is not None:
+            stats_results[cid] = {"ok": True, "stats": cached}
+        else:
+            missing.append(cid)
+    stats_results.update(await _fetch_stats(manager, missing))
+
+    # Compute usage for every container with stats in one batch
+    ok_ids = [cid for cid in running_ids if (stats_results.get(cid) or {}).get("ok")]
+    cpus, mems = _usage_percents([stats_results[cid]["stats"] or {} for cid in ok_ids])
+    usage = dict(zip(ok_ids, zip(cpus, mems)))
+
+    running_flags: List[bool] = []
+    for s in instances:
+        cid = s["id"]
+        name = s.get("name")
+        image = s.get("image") or ""
+        running = (s.get("state") == "running")
+
+        logger.debug("Checking health for container %s (%s) - running: %s", cid, name, running)
 
         cpu = 0.0
         mem = 0.0
         if running:
-            try:
-                res = manager.container_stats(cid)
-                if res.get("ok"):
-                    stats = res["stats"] or {}
-                    cpu = _cpu_percent(stats) or 0.0
-                    mem = _mem_percent(stats) or 0.0
-                    logger.debug(f"Container {cid}: CPU={cpu:.1f}%, MEM={mem:.1f}%")
-                else:
-                    logger.warning(f"Failed to get stats for {cid}: {res.get('error')}")
-            except Exception as e:
-                logger.error(f"Error getting stats for {cid}: {e}")
+            if cid in usage:
+                cpu, mem = usage[cid]
+                logger.debug("Container %s: CPU=%.1f%%, MEM=%.1f%%", cid, cpu, mem)
+            else:
+                res = stats_results.get(cid) or {}
+                logger.warning(f"Failed to get stats for {cid}: {res.get('error')}")
         else:
-            logger.debug(f"Container {cid} not running, skipping stats collection")
+            logger.debug("Container %s not running, skipping stats collection", cid)
 
-        status = _status(running, cpu, mem)
-        logger.debug(f"Container {cid} health status: {status}")
-
-        # Write snapshot to Postgres
-        try:
-            store.record_health_snapshot({
-                "image": image,
-                "container_id": cid,
-                "name": name,
-                "host": host,
-                "cpu_usage": cpu,
-                "memory_usage": mem,
-                "disk_usage": disk,
-                "status": status,
-            })
-        except Exception as e:
-            logger.error(f"Failed to record health snapshot for {cid}: {e}")
+        running_flags.append(running)
+        snapshots.append({
+            "image": image,
+            "container_id": cid,
+            "name": name,
+            "host": host,
+            "cpu_usage": cpu,
+            "memory_usage": mem,
+            "disk_usage": disk,
+            "status": None,  # filled in below for the whole batch
+        })
+
+    statuses = _statuses(
+        running_flags,
+        [snap["cpu_usage"] for snap in snapshots],
+        [snap["memory_usage"] for snap in snapshots],
+    )
+    for snap, status in zip(snapshots, statuses):
+        snap["status"] = status
+        logger.debug("Container %s health status: %s", snap["container_id"], status)
+
+    # Idle containers only need a heartbeat row; skip writes that add nothing new
+    now = time.monotonic()
+    changed = [
+        snap for snap in snapshots
+        if state_tracker.needs_snapshot(
+            snap["container_id"], snap["status"], snap["cpu_usage"], snap["memory_usage"], now)
+    ]
+    logger.debug("Writing %d of %d health snapshots", len(changed), len(snapshots))
+
+    # Write the cycle's state-change events and snapshots in a single transaction
+    try:
+        await _run_blocking(store.record_events_and_snapshots, events, changed)
+        for snap in changed:
+            state_tracker.mark_written(
+                snap["container_id"], snap["status"], snap["cpu_usage"], snap["memory_usage"], now)
+    except Exception as e:
+        logger.error(f"Failed to record lifecycle events and health snapshots: {e}")
 
     # Clean up removed containers from state tracker
     state_tracker.cleanup_removed_containers(current_container_ids)
+    stats_cache.reap(set(running_ids))
 
     logger.info(f"Health snapshot collection completed for {len(instances)} containers")
 
-def run_forever() -> None:
-    # Remove the basicConfig since we're using our custom logger
+def run_forever(shard_id: int = 0, num_shards: int = 1) -> None:
+    configure_logging()
     manager = ContainerManager()
     store = PostgresStore()
 
-    logger.info("Health monitor starting: interval=%ss, retention_days=%s, store.enabled=%s",
-                 INTERVAL_SEC, RETENTION_DAYS, store.enabled)
+    logger.info("Health monitor starting: interval=%ss, retention_days=%s, store.enabled=%s, shard=%s/%s",
+                 INTERVAL_SEC, RETENTION_DAYS, store.enabled, shard_id, num_shards)
 
-    while True:
-        t0 = time.time()
+    # Signal handlers can only be installed from the main thread
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, lambda *_: _stop.set())
+
+    asyncio.run(_loop(manager, store, shard_id, num_shards))
+
+    store.flush()
+    logger.info("Health monitor stopped")
+    # Shard workers exit via os._exit, which skips the atexit listener stop
+    shutdown_logging()
+
+def run_sharded(num_shards: int = MONITOR_SHARDS) -> None:
+    """Run one run_forever worker process per shard and wait for them to exit"""
+    configure_logging()
+    if num_shards <= 1:
+        run_forever()
+        return
+
+    workers = [
+        multiprocessing.Process(
+            target=run_forever, args=(shard_id, num_shards), name=f"health-monitor-{shard_id}"
+        )
+        for shard_id in range(num_shards)
+    ]
+
+    def _terminate(*_: Any) -> None:
+        for worker in workers:
+            if worker.is_alive():
+                worker.terminate()
+
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, _terminate)
+
+    logger.info(f"Starting {num_shards} health monitor workers")
+    # Each worker builds its own ContainerManager, PostgresStore and state tracker
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    logger.info("Health monitor workers stopped")
+
+async def _loop(
+    manager: ContainerManager, store: PostgresStore, shard_id: int = 0, num_shards: int = 1
+) -> None:
+    next_run = time.monotonic()
+    last_prune: Optional[float] = None
+    while not _stop.is_set():
+        t0 = time.monotonic()
         try:
-            sample_once(manager, store)
-            # simple retention (optional)
-            if RETENTION_DAYS > 0:
+            await sample_once(manager, store, shard_id, num_shards)
+            # simple retention (optional); a daily concern, so only every PRUNE_INTERVAL_SEC
+            # and only from the first shard, since it deletes across all containers
+            if RETENTION_DAYS > 0 and shard_id == 0 and (last_prune is None or t0 - last_prune >= PRUNE_INTERVAL_SEC):
                 try:
-                    pruned = store.prune_old_health(RETENTION_DAYS)
+                    pruned = await _run_blocking(store.prune_old_health, RETENTION_DAYS)
+                    last_prune = t0
                     if pruned > 0:
                         logger.info(f"Pruned {pruned} old health records")
                 except Exception as e:
@@ -261,11 +647,22 @@ def run_forever() -> None:
         except Exception as e:
             logger.exception("Health monitor loop error: %s", e)
 
-        # sleep the remaining time in the minute
-        elapsed = time.time() - t0
-        to_sleep = max(1.0, INTERVAL_SEC - elapsed)
-        logger.debug(f"Health monitor loop completed in {elapsed:.2f}s, sleeping for {to_sleep:.2f}s")
-        time.sleep(to_sleep)
+        # sleep until the next fixed deadline so the cadence doesn't drift
+        elapsed = time.monotonic() - t0
+        next_run += INTERVAL_SEC
+        to_sleep = max(0.0, next_run - time.monotonic())
+        if to_sleep == 0.0:
+            # overran the interval; restart the schedule instead of bursting to catch up
+            next_run = time.monotonic()
+        logger.debug("Health monitor loop completed in %.2fs, sleeping for %.2fs", elapsed, to_sleep)
+        # _stop is a threading.Event (set from a signal handler), so wait on it off-loop
+        await asyncio.get_running_loop().run_in_executor(None, _stop.wait, to_sleep)
+
+    await aclose_client()
+
+def stop() -> None:
+    """Ask run_forever to exit after the current cycle"""
+    _stop.set()
 
 if __name__ == "__main__":
-    run_forever()
+    run_sharded()
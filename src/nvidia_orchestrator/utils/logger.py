@@ -3,61 +3,176 @@ Logging configuration for NVIDIA Orchestrator.
 
 This module provides centralized logging configuration for the entire
 application.
+
+Importing the package leaves logging configuration alone, so a host
+application keeps its own handlers and levels; the package loggers just
+propagate to it. The orchestrator's own entry points call
+``configure_logging()``, which applies ``LOGGING_CONFIG`` via
+``logging.config.dictConfig`` once per process. That attaches a handler to the
+``nvidia-orchestrator`` logger only: log calls just enqueue the record and a
+background ``QueueListener`` thread does the actual writing, so slow stdout or
+disk I/O never blocks the caller. Set ``LOG_FILE`` to also write to a rotating
+log file.
 """
 
 from __future__ import annotations
 
+import atexit
 import logging
+import logging.config
+import os
+import queue
 import sys
-from typing import Optional
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Any, Dict, List, Optional, cast
+
+LOG_FORMAT = '[%(asctime)s] [%(name)s] [%(levelname)s] %(message)s'
+
+_listener: Optional[QueueListener] = None
+_queue_handlers: List[QueueHandler] = []
+_configured = False
+_configure_lock = threading.Lock()
+
+
+def _start_listener() -> queue.Queue[logging.LogRecord]:
+    """Start the shared background listener once per process and return its queue."""
+    global _listener
+    if _listener is not None:
+        return cast("queue.Queue[logging.LogRecord]", _listener.queue)
+
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers: List[logging.Handler] = []
+
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(formatter)
+    handlers.append(console_handler)
+
+    log_file = os.getenv("LOG_FILE")
+    if log_file:
+        file_handler = RotatingFileHandler(log_file, maxBytes=50_000_000, backupCount=5)
+        file_handler.setFormatter(formatter)
+        handlers.append(file_handler)
+
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(-1)
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+    return log_queue
+
+
+def _restart_listener_in_child() -> None:
+    """A forked child inherits the queue but not the listener thread; start a fresh one."""
+    global _listener
+    if _listener is None:
+        return
+    handlers = _listener.handlers
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(-1)
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+    for handler in _queue_handlers:
+        handler.queue = log_queue
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_listener_in_child)
+
+
+def _queue_handler() -> QueueHandler:
+    """dictConfig factory for the handler that feeds the background listener."""
+    handler = QueueHandler(_start_listener())
+    _queue_handlers.append(handler)
+    return handler
+
+
+LOGGING_CONFIG: Dict[str, Any] = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "queue": {"()": _queue_handler},
+    },
+    "loggers": {
+        "nvidia-orchestrator": {"level": "INFO", "handlers": ["queue"], "propagate": False},
+    },
+}
+
+
+def configure_logging() -> None:
+    """
+    Apply ``LOGGING_CONFIG`` once per process.
+
+    Call from entry points only, never at import. Safe to call from several
+    of them; only the first call has any effect.
+    """
+    global _configured
+    with _configure_lock:
+        if _configured:
+            return
+        logging.config.dictConfig(LOGGING_CONFIG)
+        _configured = True
+
+
+def shutdown_logging() -> None:
+    """
+    Stop the background listener after it has written every queued record.
+
+    Also registered with atexit (a second call is a no-op), but processes that
+    end through ``os._exit`` (multiprocessing children) skip atexit, so their
+    entry points call this before returning.
+    """
+    global _listener
+    with _configure_lock:
+        listener, _listener = _listener, None
+    if listener is not None:
+        listener.stop()
 
 
 def get_logger(name: Optional[str] = None) -> logging.Logger:
     """
-    Get a configured logger instance.
-    
+    Get a logger instance.
+
     Args:
         name: Logger name. If None, uses the default service name.
-        
+
     Returns:
-        Configured logger instance.
+        Logger instance. Package loggers reach the queue handler once
+        configure_logging() has run; other names propagate to the host's
+        handlers unless passed to configure_logger().
     """
     if name is None:
         name = "nvidia-orchestrator"
 
-    # Check if logger already exists
     logger_instance = logging.getLogger(name)
-
-    # Only configure if not already configured
-    if not logger_instance.handlers:
-        configure_logger(logger_instance)
-
+    if logger_instance.level == logging.NOTSET:
+        logger_instance.setLevel(logging.INFO)
     return logger_instance
 
 
 def configure_logger(logger_instance: logging.Logger) -> None:
     """
-    Configure a logger instance with console handler only.
-    
+    Configure a logger instance to log at INFO through the shared handler.
+
+    Loggers under ``nvidia-orchestrator`` reach it through the package logger;
+    any other logger gets its own queue handler (once) and stops propagating,
+    so its records aren't also written by the host's handlers.
+
     Args:
         logger_instance: Logger instance to configure.
     """
+    configure_logging()
     logger_instance.setLevel(logging.INFO)
-
-    # Format for log messages
-    formatter = logging.Formatter(
-        '[%(asctime)s] [%(name)s] [%(levelname)s] %(message)s'
-    )
-
-    # Console handler only - no file logging
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(formatter)
-    logger_instance.addHandler(console_handler)
+    name = logger_instance.name
+    if name == "nvidia-orchestrator" or name.startswith("nvidia-orchestrator."):
+        return
+    if not any(h in _queue_handlers for h in logger_instance.handlers):
+        logger_instance.addHandler(_queue_handler())
+        logger_instance.propagate = False
 
 
-# Create a default logger instance for backward compatibility
+# Create the default logger instance for backward compatibility
 logger = get_logger("nvidia-orchestrator")
 
 
 # Export for convenience
-__all__ = ["get_logger", "logger", "configure_logger"]
+__all__ = ["get_logger", "logger", "configure_logger", "configure_logging", "shutdown_logging", "LOGGING_CONFIG"]
@@ -11,9 +11,6 @@ import pytest
 src_path = os.path.join(os.path.dirname(__file__), '..', 'src')
 sys.path.insert(0, os.path.abspath(src_path))
 
-# Import test fixtures
-from tests.fixtures.api_fixtures import *
-
 
 @pytest.fixture(scope="session", autouse=True)
 def setup_test_environment():
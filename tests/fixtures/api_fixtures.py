@@ -2,66 +2,146 @@
 API test fixtures for integration tests.
 """
 
+import asyncio
+import copy
+import logging
 import os
+import socket
 import time
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
+import docker
 import httpx
 import pytest
+import pytest_asyncio
+from docker.errors import DockerException, ImageNotFound
+from filelock import FileLock
 
+from nvidia_orchestrator.core.container_manager import ContainerManager
 
-@pytest.fixture
+log = logging.getLogger(__name__)
+
+
+def find_container(client: httpx.Client, container_id: str) -> Optional[Dict[str, Any]]:
+    """Fetch /containers once and return the entry for container_id, or None if it isn't listed."""
+    response = client.get("/containers")
+    assert response.status_code == 200
+
+    containers_data = response.json()
+    assert "containers" in containers_data
+
+    for container in containers_data["containers"]:
+        if container.get("id") == container_id:
+            return container
+    return None
+
+
+def worker_port(base: int) -> int:
+    """Offset a host port by the pytest-xdist worker number so parallel workers don't collide."""
+    worker = os.getenv("PYTEST_XDIST_WORKER", "gw0")
+    return base + int(worker[2:] or 0)
+
+
+@pytest.fixture(scope="session")
 def base_url() -> str:
     """Base URL for the API server."""
     return os.getenv("TEST_BASE_URL", "http://localhost:8000")
 
 
-@pytest.fixture
-def api_client(base_url: str) -> httpx.Client:
-    """HTTP client for API requests."""
-    return httpx.Client(base_url=base_url, timeout=30.0)
+@pytest.fixture(scope="session")
+def api_client(base_url: str) -> Iterator[httpx.Client]:
+    """HTTP client for API requests, shared by the whole session."""
+    # One keep-alive pool for every test instead of a new TCP connection per request
+    with httpx.Client(
+        base_url=base_url,
+        timeout=30.0,
+        # Limits go on the transport; httpx ignores Client(limits=...) when a transport is given
+        transport=httpx.HTTPTransport(
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            retries=2,
+        ),
+    ) as client:
+        yield client
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_client(base_url: str) -> AsyncIterator[httpx.AsyncClient]:
+    """Async HTTP client shared by async tests running on the session event loop."""
+    async with httpx.AsyncClient(
+        base_url=base_url,
+        timeout=30.0,
+        limits=httpx.Limits(max_keepalive_connections=16),
+    ) as client:
+        yield client
+
+
+@pytest.fixture(autouse=True)
+def reset_api_client_state(request: pytest.FixtureRequest) -> None:
+    """Keep tests isolated while they share one client: drop cookies from earlier tests."""
+    if "api_client" in request.fixturenames:
+        request.getfixturevalue("api_client").cookies.clear()
+
+
+@pytest.fixture(scope="session")
 def wait_for_service(api_client: httpx.Client, base_url: str) -> None:
-    """Wait for the API service to be ready before running tests."""
-    max_attempts = 30
-    for attempt in range(max_attempts):
+    """Wait once per session for the API service to be ready."""
+    timeout = 30.0
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    while time.monotonic() < deadline:
         try:
             response = api_client.get("/health")
             if response.status_code == 200:
+                # Pay FastAPI's first-request schema build here rather than inside some test
+                api_client.get("/openapi.json")
                 return
-        except Exception:
+        except httpx.TransportError:
             pass
-        time.sleep(1)
+        # Back off exponentially so a service that is already up is seen within milliseconds
+        time.sleep(delay)
+        delay = min(delay * 2, 1.0)
 
-    raise RuntimeError(f"Service at {base_url} did not become ready after {max_attempts} seconds")
+    raise RuntimeError(f"Service at {base_url} did not become ready after {timeout:.0f} seconds")
 
 
-@pytest.fixture
-def valid_start_body() -> Dict[str, Any]:
-    """Valid StartBody structure for testing."""
-    return {
+@pytest.fixture(scope="module")
+def start_body_factory() -> Callable[..., Dict[str, Any]]:
+    """Build fresh StartBody dicts from a shared template; keyword arguments replace top-level fields."""
+    template = {
         "image": "nginx:alpine",
         "image_url": "https://hub.docker.com/nginx:alpine",
-        "min_replicas": 1,
-        "max_replicas": 3,
         "resources": {
             "cpu": "0.1",
             "memory": "64Mi",
             "disk": "1GB"
-        },
-        "env": {
+        }
+    }
+
+    def make(**overrides: Any) -> Dict[str, Any]:
+        body = copy.deepcopy(template)
+        body.update(overrides)
+        return body
+
+    return make
+
+
+@pytest.fixture
+def valid_start_body(start_body_factory: Callable[..., Dict[str, Any]]) -> Dict[str, Any]:
+    """Valid StartBody structure for testing."""
+    return start_body_factory(
+        min_replicas=1,
+        max_replicas=3,
+        env={
             "TEST_ENV": "integration_test",
             "NODE_ENV": "test"
         },
-        "ports": [
+        ports=[
             {
                 "container": 80,
-                "host": 8080
+                "host": worker_port(8080)
             }
         ]
-    }
+    )
 
 
 @pytest.fixture
@@ -103,76 +183,174 @@ def redis_start_body() -> Dict[str, Any]:
         "ports": [
             {
                 "container": 6379,
-                "host": 6379
+                "host": worker_port(6379)
             }
         ]
     }
 
 
-@pytest.fixture
-def invalid_start_bodies() -> List[Dict[str, Any]]:
-    """List of invalid StartBody structures for negative testing."""
-    return [
-        # Missing required image field
+# Invalid StartBody structures for negative testing, one test case each
+INVALID_START_BODIES = [
+    pytest.param(
         {
             "image_url": "https://example.com/image.tar",
             "resources": {"cpu": "0.1", "memory": "64Mi", "disk": "1GB"}
         },
-        # Missing required image_url field
+        id="missing-image",
+    ),
+    pytest.param(
         {
             "image": "nginx:alpine",
             "resources": {"cpu": "0.1", "memory": "64Mi", "disk": "1GB"}
         },
-        # Missing required resources field
+        id="missing-image-url",
+    ),
+    pytest.param(
         {
             "image": "nginx:alpine",
             "image_url": "https://example.com/image.tar"
         },
-        # Invalid resources structure
+        id="missing-resources",
+    ),
+    pytest.param(
         {
             "image": "nginx:alpine",
             "image_url": "https://example.com/image.tar",
             "resources": "invalid"
         },
-        # Invalid min_replicas (negative)
+        id="invalid-resources",
+    ),
+    pytest.param(
         {
             "image": "nginx:alpine",
             "image_url": "https://example.com/image.tar",
             "min_replicas": -1,
             "resources": {"cpu": "0.1", "memory": "64Mi", "disk": "1GB"}
         },
-        # Invalid port mapping
+        id="negative-min-replicas",
+    ),
+    pytest.param(
         {
             "image": "nginx:alpine",
             "image_url": "https://example.com/image.tar",
             "resources": {"cpu": "0.1", "memory": "64Mi", "disk": "1GB"},
             "ports": [{"container": "invalid", "host": 8080}]
-        }
-    ]
+        },
+        id="invalid-port",
+    ),
+]
+
+
+@pytest.fixture(scope="session")
+def session_container_ids(docker_client: Optional[docker.DockerClient]) -> Iterator[Set[str]]:
+    """Ids of every container the session started; whatever is left is removed in one sweep at the end."""
+    container_ids: Set[str] = set()
+    yield container_ids
+
+    if docker_client is None or not container_ids:
+        return
+    # Per-test cleanup only stops containers; remove this session's leftovers with one filtered listing
+    try:
+        leftovers = docker_client.containers.list(all=True, filters={"id": sorted(container_ids)})
+    except DockerException as e:
+        log.warning("Failed to list test containers for removal: %s", e)
+        return
+    for container in leftovers:
+        try:
+            container.remove(force=True)
+        except DockerException as e:
+            log.warning("Failed to remove container %s: %s", container.id, e)
 
 
 @pytest.fixture
-def cleanup_containers(api_client: httpx.Client):
+def cleanup_containers(api_client: httpx.Client, session_container_ids: Set[str]):
     """Fixture to cleanup test containers after tests."""
     created_containers = []
 
     def add_container(container_id: str):
         created_containers.append(container_id)
+        session_container_ids.add(container_id)
 
     yield add_container
 
-    # Cleanup after test
-    for container_id in created_containers:
-        try:
-            # Stop and remove container
-            api_client.post(f"/containers/{container_id}/stop")
-            time.sleep(1)
-            # Note: You might need to add a delete endpoint or use Docker API directly
-        except Exception as e:
-            print(f"Warning: Failed to cleanup container {container_id}: {e}")
+    if not created_containers:
+        return
+
+    # Cleanup after test: stop all containers concurrently, one round-trip in total
+    async def stop_all() -> List[Any]:
+        async with httpx.AsyncClient(base_url=str(api_client.base_url), timeout=10.0) as client:
+            return await asyncio.gather(
+                *(
+                    client.post(f"/containers/{container_id}/stop", json={"instanceId": container_id})
+                    for container_id in created_containers
+                ),
+                return_exceptions=True,
+            )
+
+    # Note: You might need to add a delete endpoint or use Docker API directly
+    for container_id, result in zip(created_containers, asyncio.run(stop_all())):
+        if isinstance(result, Exception):
+            log.warning("Failed to cleanup container %s: %s", container_id, result)
+        elif result.status_code != 200:
+            log.warning("Failed to cleanup container %s: HTTP %s %s", container_id, result.status_code, result.text)
 
 
 @pytest.fixture
+def started_container(
+    api_client: httpx.Client, cleanup_containers
+) -> Callable[[Dict[str, Any]], Tuple[Optional[str], Dict[str, Any]]]:
+    """Start a container via /start/container, register it for cleanup and return (container_id, response)."""
+    def start(body: Dict[str, Any]) -> Tuple[Optional[str], Dict[str, Any]]:
+        response = api_client.post("/start/container", json=body)
+        assert response.status_code == 200, f"Failed to start container: {response.text}"
+
+        response_data = response.json()
+        container_id = response_data.get("container_id")
+        if container_id:
+            cleanup_containers(container_id)
+        return container_id, response_data
+
+    return start
+
+
+@pytest.fixture(scope="module")
+def running_container(
+    api_client: httpx.Client,
+    start_body_factory: Callable[..., Dict[str, Any]],
+    session_container_ids: Set[str],
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """One warm nginx container per module for read-only tests; returns (container_id, response)."""
+    # Host port 0 lets Docker pick a free one, so tests binding worker_port(8080) don't collide
+    body = start_body_factory(
+        env={"TEST_ENV": "integration_test"},
+        ports=[{"container": 80, "host": 0}],
+    )
+    response = api_client.post("/start/container", json=body)
+    assert response.status_code == 200, f"Failed to start container: {response.text}"
+
+    response_data = response.json()
+    container_id = response_data.get("container_id")
+    assert container_id is not None, "Container ID should be returned"
+    session_container_ids.add(container_id)
+
+    yield container_id, response_data
+
+    # Tests that stop or delete containers start their own, so this one is still ours to stop
+    response = api_client.post(f"/containers/{container_id}/stop", json={"instanceId": container_id})
+    if response.status_code != 200:
+        log.warning("Failed to cleanup container %s: HTTP %s %s", container_id, response.status_code, response.text)
+
+
+@pytest.fixture(scope="session")
+def refused_address() -> str:
+    """host:port on loopback with nothing listening, so connections are refused immediately."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"127.0.0.1:{port}"
+
+
+@pytest.fixture(scope="session")
 def sample_image_ids() -> List[str]:
     """Sample image IDs for testing."""
     return [
@@ -181,3 +359,56 @@ def sample_image_ids() -> List[str]:
         "hello-world:latest",
         "alpine:latest"
     ]
+
+
+@pytest.fixture(scope="session")
+def docker_client() -> Iterator[Optional[docker.DockerClient]]:
+    """One connection to the local Docker daemon for the whole session, or None if unavailable."""
+    try:
+        # Same pool size as the API's own client; docker-py's default of 10 serializes fan-out
+        client = docker.from_env(max_pool_size=ContainerManager.DOCKER_MAX_POOL_SIZE)
+    except DockerException as e:
+        log.warning("Docker unavailable: %s", e)
+        yield None
+        return
+    try:
+        yield client
+    finally:
+        client.close()
+
+
+@pytest.fixture(scope="session")
+def warm_up_images(
+    docker_client: Optional[docker.DockerClient],
+    sample_image_ids: List[str],
+    tmp_path_factory: pytest.TempPathFactory,
+) -> None:
+    """Pull the test images once per session so no single test pays for a cold image cache."""
+    if os.getenv("SKIP_WARMUP") or docker_client is None:
+        return
+    # Set only on pytest-xdist workers, so serial runs don't depend on the plugin
+    if os.getenv("PYTEST_XDIST_WORKER") is None:
+        _pull_images(docker_client, sample_image_ids)
+        return
+
+    # Every xdist worker runs session fixtures; the first one pulls, the others wait on the lock
+    marker = tmp_path_factory.getbasetemp().parent / "images-warm"
+    with FileLock(f"{marker}.lock"):
+        if not marker.exists():
+            _pull_images(docker_client, sample_image_ids)
+            marker.touch()
+
+
+def _pull_images(client: docker.DockerClient, images: List[str]) -> None:
+    # The API has no pull endpoint; pull through the local Docker daemon the API runs against
+    for image in images:
+        try:
+            # Only go to the registry for images the daemon doesn't already have
+            client.images.get(image)
+        except ImageNotFound:
+            try:
+                client.images.pull(image)
+            except DockerException as e:
+                log.warning("Failed to pull %s: %s", image, e)
+        except DockerException as e:
+            log.warning("Failed to inspect %s: %s", image, e)
@@ -0,0 +1,27 @@
+"""
+Polling helper shared by unit and integration tests (standard library only).
+"""
+
+import time
+from typing import Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+def wait_until(
+    predicate: Callable[[], Optional[T]],
+    timeout: float = 60.0,
+    initial: float = 0.05,
+    factor: float = 1.5,
+    cap: float = 1.0,
+) -> T:
+    """Poll predicate with exponential backoff until it returns a truthy value, and return it."""
+    deadline = time.monotonic() + timeout
+    delay = initial
+    while time.monotonic() < deadline:
+        value = predicate()
+        if value:
+            return value
+        time.sleep(delay)
+        delay = min(delay * factor, cap)
+    raise TimeoutError(f"Condition not met within {timeout} seconds")
@@ -0,0 +1,8 @@
+"""
+Pytest configuration for the integration tests.
+
+The API fixtures need docker, httpx and filelock, so they are only loaded here
+and the unit tests can run without the integration stack.
+"""
+
+from tests.fixtures.api_fixtures import *  # noqa: F401,F403
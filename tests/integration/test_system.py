@@ -4,30 +4,62 @@ Simple test script for Team 3 Orchestrator
 Run this to validate your system before tomorrow's testing
 """
 
+import asyncio
+import atexit
+import random
 import time
 
-import requests
+import httpx
 
 BASE_URL = "http://localhost:8000"
 
-def test_endpoint(endpoint, expected_status=200):
-    """Test a single endpoint"""
+# One keep-alive connection pool for all sync requests instead of a new one per request
+CLIENT = httpx.Client(base_url=BASE_URL, timeout=10)
+atexit.register(CLIENT.close)
+
+def wait_ready(url, timeout=30):
+    """Poll url until it returns 200, backing off exponentially with jitter"""
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    jitter = random.Random()
+    while time.monotonic() < deadline:
+        try:
+            if CLIENT.get(url, timeout=2).status_code == 200:
+                return True
+        except httpx.HTTPError:
+            pass
+        time.sleep(delay + jitter.uniform(0, delay * 0.5))
+        delay = min(delay * 1.7, 1.0)
+    return False
+
+async def probe(client, endpoint):
+    """GET a single endpoint; returns (endpoint, response, error)"""
     try:
-        response = requests.get(f"{BASE_URL}{endpoint}", timeout=10)
-        if response.status_code == expected_status:
-            print(f"✅ {endpoint}: OK")
-            return True
-        else:
-            print(f"❌ {endpoint}: FAILED (Status: {response.status_code})")
-            return False
+        return endpoint, await client.get(endpoint, timeout=10), None
     except Exception as e:
-        print(f"❌ {endpoint}: ERROR - {e}")
+        return endpoint, None, e
+
+async def probe_all(endpoints):
+    """Probe independent read-only endpoints concurrently, results in request order"""
+    async with httpx.AsyncClient(base_url=BASE_URL) as client:
+        return await asyncio.gather(*(probe(client, endpoint) for endpoint in endpoints))
+
+def check_endpoint(endpoint, response, error, expected_status=200):
+    """Check a probe result"""
+    if error is not None:
+        print(f"❌ {endpoint}: ERROR - {error}")
+        return False
+    if response.status_code == expected_status:
+        print(f"✅ {endpoint}: OK")
+        return True
+    else:
+        print(f"❌ {endpoint}: FAILED (Status: {response.status_code})")
         return False
 
 def test_post_endpoint(endpoint, data, expected_status=200):
     """Test a POST endpoint"""
     try:
-        response = requests.post(f"{BASE_URL}{endpoint}", json=data, timeout=10)
+        response = CLIENT.post(endpoint, json=data)
         if response.status_code == expected_status:
             print(f"✅ {endpoint}: OK")
             return True
@@ -44,40 +76,25 @@ def main():
 
     # Wait for service to be ready
     print("⏳ Waiting for service to be ready...")
-    time.sleep(5)
+    if not wait_ready("/health"):
+        print(f"⚠️  Service at {BASE_URL} did not become ready; probing anyway")
 
     tests_passed = 0
     total_tests = 0
 
-    # Test 1: Basic health check
-    total_tests += 1
-    if test_endpoint("/health"):
-        tests_passed += 1
-
-    # Test 2: Detailed health check
-    total_tests += 1
-    if test_endpoint("/health/detailed"):
-        tests_passed += 1
-
-    # Test 3: System resources
-    total_tests += 1
-    if test_endpoint("/system/resources"):
-        tests_passed += 1
-
-    # Test 4: List containers
-    total_tests += 1
-    if test_endpoint("/containers"):
-        tests_passed += 1
-
-    # Test 5: List images
-    total_tests += 1
-    if test_endpoint("/images"):
-        tests_passed += 1
-
-    # Test 6: Integration test
-    total_tests += 1
-    if test_endpoint("/test/integration"):
-        tests_passed += 1
+    # Tests 1-6: independent read-only probes, sent concurrently
+    endpoints = [
+        "/health",             # Basic health check
+        "/health/detailed",    # Detailed health check
+        "/system/resources",   # System resources
+        "/containers",         # List containers
+        "/images",             # List images
+        "/test/integration",   # Integration test
+    ]
+    for endpoint, response, error in asyncio.run(probe_all(endpoints)):
+        total_tests += 1
+        if check_endpoint(endpoint, response, error):
+            tests_passed += 1
 
     # Test 7: Start a test container with new typed structure
     total_tests += 1
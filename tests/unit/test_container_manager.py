@@ -0,0 +1,115 @@
+"""
+Unit tests for ContainerManager's Docker connection handling, driven by a fake client.
+"""
+
+from typing import Any, List
+
+import pytest
+from docker.errors import NotFound
+from requests.exceptions import ConnectionError as RequestsConnectionError
+
+from nvidia_orchestrator.core import container_manager
+from nvidia_orchestrator.core.container_manager import ContainerManager, DockerUnavailableError
+
+
+class FakeContainer:
+    def __init__(self, cid: str) -> None:
+        self.id = cid
+        self.name = f"name-{cid}"
+        self.status = "running"
+        self.attrs: dict = {}
+        self.labels = {ContainerManager.LABEL_KEY: "img"}
+        self.image = None
+
+    def stats(self, stream: bool) -> dict:
+        return {"cpu_stats": {}}
+
+
+class FakeClient:
+    """docker.DockerClient stand-in; set `down` to make every call fail to connect."""
+
+    def __init__(self) -> None:
+        self.pings = 0
+        self.down = False
+        self.closed = False
+        self.containers = self
+
+    def ping(self) -> bool:
+        self.pings += 1
+        return True
+
+    def close(self) -> None:
+        self.closed = True
+
+    def get(self, cid: str) -> FakeContainer:
+        if self.down:
+            raise RequestsConnectionError("connection refused")
+        if cid == "missing":
+            raise NotFound("no such container")
+        return FakeContainer(cid)
+
+    def list(self, all: bool, filters: Any = None) -> List[FakeContainer]:
+        if self.down:
+            raise RequestsConnectionError("connection refused")
+        return [FakeContainer("a")]
+
+
+class _DisabledStore:
+    enabled = False
+
+
+@pytest.fixture
+def clients(monkeypatch: pytest.MonkeyPatch) -> List[FakeClient]:
+    """Every client docker.from_env hands out, in order."""
+    made: List[FakeClient] = []
+
+    def from_env(**kwargs: Any) -> FakeClient:
+        made.append(FakeClient())
+        return made[-1]
+
+    monkeypatch.setattr(container_manager.docker, "from_env", from_env)
+    monkeypatch.setattr(container_manager, "PostgresStore", _DisabledStore)
+    return made
+
+
+def test_calls_reuse_client_without_pinging(clients: List[FakeClient]):
+    """Only the connect pings the daemon; later calls go straight to it."""
+    manager = ContainerManager()
+    for _ in range(3):
+        assert manager.container_stats("c1")["ok"]
+    assert manager.container_stats("missing")["error"] == "not-found"
+
+    assert len(clients) == 1
+    assert clients[0].pings == 1
+
+
+def test_connection_failure_raises_and_reconnects_after_cooldown(clients: List[FakeClient], monkeypatch: pytest.MonkeyPatch):
+    """A refused connection becomes DockerUnavailableError; the client is replaced once the cooldown passes."""
+    manager = ContainerManager()
+    store = manager._store
+    clients[0].down = True
+
+    with pytest.raises(DockerUnavailableError):
+        manager.stop_container("c1")
+    assert manager.client is None and clients[0].closed
+    # Inside the cooldown nothing tries to reconnect
+    with pytest.raises(DockerUnavailableError):
+        manager.container_stats("c1")
+    assert len(clients) == 1
+
+    monkeypatch.setattr(ContainerManager, "RECONNECT_COOLDOWN_SEC", 0.0)
+    assert manager.container_stats("c1")["ok"]
+    assert len(clients) == 2
+    assert manager._store is store
+
+
+def test_stale_listing_only_when_allowed(clients: List[FakeClient]):
+    """list_managed_containers falls back to the last listing only with allow_stale."""
+    manager = ContainerManager()
+    assert [s["id"] for s in manager.list_managed_containers()] == ["a"]
+    clients[0].down = True
+
+    with pytest.raises(DockerUnavailableError):
+        manager.list_managed_containers()
+    stale = manager.list_managed_containers(allow_stale=True)
+    assert [(s["id"], s["stale"]) for s in stale] == [("a", True)]
@@ -0,0 +1,287 @@
+"""
+Unit tests for the health monitor's caches, driven by fake Docker clients.
+"""
+
+import asyncio
+import json
+import queue
+import threading
+from typing import Any, Dict, Iterator, List
+
+import httpx
+
+from nvidia_orchestrator.monitoring import health_monitor
+from nvidia_orchestrator.monitoring.health_monitor import (
+    HEARTBEAT_SEC,
+    ContainerInventory,
+    ContainerStateTracker,
+    StatsCache,
+    _get_container_port,
+    _usage_fields,
+)
+from tests.fixtures.wait import wait_until
+
+_END = object()
+
+
+def _feed(source: "queue.Queue[Any]") -> Iterator[Any]:
+    """Yield items put on source until _END (an exception instance is raised instead)."""
+    while True:
+        item = source.get(timeout=10)
+        if item is _END:
+            return
+        if isinstance(item, Exception):
+            raise item
+        yield item
+
+
+class FakeStatsManager:
+    """ContainerManager stand-in whose client.api.stats streams from per-container queues."""
+
+    def __init__(self) -> None:
+        self.streams: Dict[str, queue.Queue[Any]] = {}
+        self.opened: List[str] = []
+        self.client = self
+        self.api = self
+
+    def stream(self, cid: str) -> "queue.Queue[Any]":
+        return self.streams.setdefault(cid, queue.Queue())
+
+    def stats(self, cid: str, stream: bool, decode: bool) -> Iterator[Any]:
+        self.opened.append(cid)
+        return _feed(self.stream(cid))
+
+
+class FakeInventoryManager:
+    """ContainerManager stand-in with a fixed listing and a scripted Docker events stream."""
+
+    def __init__(self, listing: List[Dict[str, Any]]) -> None:
+        self.listing = listing
+        self.list_calls = 0
+        self.events_streams: List[queue.Queue[Any]] = []
+        self.inspected: Dict[str, Dict[str, Any]] = {}
+        self.client = self
+        self.api = self
+        self.containers = self
+
+    def list_managed_containers(self) -> List[Dict[str, Any]]:
+        self.list_calls += 1
+        return [dict(s) for s in self.listing]
+
+    def events(self, since: int, filters: Dict[str, Any], decode: bool) -> Iterator[Any]:
+        stream: queue.Queue[Any] = queue.Queue()
+        self.events_streams.append(stream)
+        return _feed(stream)
+
+    def get(self, cid: str) -> Dict[str, Any]:
+        return self.inspected[cid]
+
+    @staticmethod
+    def _summarize_container(c: Dict[str, Any]) -> Dict[str, Any]:
+        return dict(c)
+
+
+def _stats_threads() -> List[threading.Thread]:
+    return [t for t in threading.enumerate() if t.name.startswith("stats-")]
+
+
+def test_stats_cache_keeps_latest_streamed_sample():
+    """Samples from a container's stream replace each other in the cache."""
+    manager = FakeStatsManager()
+    cache = StatsCache(manager)
+    cache.track(["c1"])
+    cache.track(["c1"])  # already followed; no second stream
+
+    manager.stream("c1").put({"n": 1})
+    wait_until(lambda: cache.get("c1"), timeout=5)
+    manager.stream("c1").put({"n": 2})
+    wait_until(lambda: (cache.get("c1") or {}).get("n") == 2, timeout=5)
+
+    assert manager.opened == ["c1"]
+    cache.reap(set())
+
+
+def test_stats_cache_reaps_streams_for_removed_containers():
+    """reap() stops the readers of containers that are gone and forgets their samples."""
+    manager = FakeStatsManager()
+    cache = StatsCache(manager)
+    cache.track(["keep", "gone"])
+    manager.stream("keep").put({"n": 1})
+    manager.stream("gone").put({"n": 1})
+    wait_until(lambda: cache.get("keep") and cache.get("gone"), timeout=5)
+
+    cache.reap({"keep"})
+
+    assert cache.get("gone") is None
+    assert cache.get("keep") is not None
+    # The reader notices the stop flag on its next sample and exits
+    manager.stream("gone").put({"n": 2})
+    wait_until(lambda: all(t.name != "stats-gone" for t in _stats_threads()), timeout=5)
+    assert cache.get("gone") is None
+
+    cache.reap(set())
+    manager.stream("keep").put({"n": 2})
+
+
+def test_stats_cache_restarts_stream_that_ended():
+    """A stream that ends on its own is dropped, so the next track() opens a new one."""
+    manager = FakeStatsManager()
+    cache = StatsCache(manager)
+    cache.track(["c1"])
+    manager.stream("c1").put({"n": 1})
+    wait_until(lambda: cache.get("c1"), timeout=5)
+
+    manager.stream("c1").put(RuntimeError("connection reset"))
+    wait_until(lambda: cache.get("c1") is None, timeout=5)
+
+    cache.track(["c1"])
+    manager.stream("c1").put({"n": 2})
+    wait_until(lambda: (cache.get("c1") or {}).get("n") == 2, timeout=5)
+    assert manager.opened == ["c1", "c1"]
+    cache.reap(set())
+    manager.stream("c1").put(_END)
+
+
+def test_inventory_follows_docker_events_without_relisting():
+    """After the first listing, start/destroy events update the inventory in place."""
+    manager = FakeInventoryManager([{"id": "a", "state": "running"}])
+    inventory = ContainerInventory(manager)
+
+    assert [s["id"] for s in inventory.snapshot()] == ["a"]
+    wait_until(lambda: manager.events_streams, timeout=5)
+    events = manager.events_streams[0]
+
+    manager.inspected["b"] = {"id": "b", "state": "running"}
+    events.put({"id": "b", "Action": "start"})
+    wait_until(lambda: {s["id"] for s in inventory.snapshot()} == {"a", "b"}, timeout=5)
+
+    manager.inspected["a"] = {"id": "a", "state": "exited"}
+    events.put({"id": "a", "Action": "die"})
+    wait_until(lambda: {s["id"]: s["state"] for s in inventory.snapshot()}.get("a") == "exited", timeout=5)
+
+    assert {s["id"]: s["_cached_port"] for s in inventory.snapshot()} == {"a": 8000, "b": 8000}
+
+    events.put({"id": "b", "Action": "destroy"})
+    wait_until(lambda: [s["id"] for s in inventory.snapshot()] == ["a"], timeout=5)
+
+    # Events alone kept the inventory current
+    assert manager.list_calls == 1
+    events.put(_END)
+
+
+def test_inventory_resyncs_when_event_stream_ends():
+    """Once the events stream drops, the next snapshot does a full listing and resubscribes."""
+    manager = FakeInventoryManager([{"id": "a", "state": "running"}])
+    inventory = ContainerInventory(manager)
+    inventory.snapshot()
+    wait_until(lambda: manager.events_streams, timeout=5)
+
+    manager.listing = [{"id": "a", "state": "running"}, {"id": "c", "state": "running"}]
+    manager.events_streams[0].put(RuntimeError("daemon restarted"))
+    inventory._watcher.join(timeout=5)
+
+    assert {s["id"] for s in inventory.snapshot()} == {"a", "c"}
+    assert manager.list_calls == 2
+    wait_until(lambda: len(manager.events_streams) == 2, timeout=5)
+    manager.events_streams[1].put(_END)
+
+
+def test_needs_snapshot_skips_unchanged_containers_until_heartbeat():
+    """Unchanged samples are skipped; a heartbeat forces a write once HEARTBEAT_SEC passes."""
+    tracker = ContainerStateTracker()
+    assert tracker.needs_snapshot("c1", "healthy", 10.0, 20.0, now=0.0)
+
+    tracker.mark_written("c1", "healthy", 10.0, 20.0, now=0.0)
+    assert not tracker.needs_snapshot("c1", "healthy", 10.0, 20.0, now=1.0)
+    # Small moves inside the same usage bucket don't count as a change
+    assert not tracker.needs_snapshot("c1", "healthy", 11.0, 21.0, now=1.0)
+    assert tracker.needs_snapshot("c1", "healthy", 10.0, 20.0, now=float(HEARTBEAT_SEC))
+
+
+def test_needs_snapshot_forces_write_on_change():
+    """A status change or a usage change across buckets is written right away."""
+    tracker = ContainerStateTracker()
+    tracker.mark_written("c1", "healthy", 10.0, 20.0, now=0.0)
+
+    assert tracker.needs_snapshot("c1", "warning", 10.0, 20.0, now=1.0)
+    assert tracker.needs_snapshot("c1", "healthy", 40.0, 20.0, now=1.0)
+    assert tracker.needs_snapshot("c1", "healthy", 10.0, 60.0, now=1.0)
+    assert tracker.needs_snapshot("c2", "healthy", 10.0, 20.0, now=1.0)
+
+
+def test_cleanup_removed_containers_forgets_written_state():
+    """Removed containers lose their tracked state, so they write again if they come back."""
+    tracker = ContainerStateTracker()
+    tracker.update_state("c1", "running")
+    tracker.mark_written("c1", "healthy", 10.0, 20.0, now=0.0)
+
+    tracker.cleanup_removed_containers(set())
+
+    assert tracker.get_previous_state("c1") is None
+    assert tracker.needs_snapshot("c1", "healthy", 10.0, 20.0, now=1.0)
+
+
+def test_container_port_uses_first_mapped_host_port():
+    """The first published host port wins; 8000 only when nothing is mapped."""
+    assert _get_container_port({"host_ports": {"80/tcp": None, "9000/tcp": [{"HostPort": "9001"}]}}) == 9001
+    assert _get_container_port({"host_ports": {"80/tcp": 8081}}) == 8081
+    assert _get_container_port({"host_ports": {"80/tcp": None}}) == 8000
+    assert _get_container_port({"_cached_port": 1234, "host_ports": {"80/tcp": 8081}}) == 1234
+
+
+def test_discovery_registration_reuses_shared_client():
+    """Registrations go through one pooled client, which aclose_client() shuts down."""
+    posted: List[Dict[str, Any]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        posted.append({"url": str(request.url), "auth": request.headers.get("Authorization"),
+                       "body": json.loads(request.content)})
+        return httpx.Response(201)
+
+    async def scenario() -> List[bool]:
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        health_monitor._HTTPX_CLIENT = client
+        health_monitor._HTTPX_CLIENT_LOOP = asyncio.get_running_loop()
+        info = {"id": "c1", "name": "n1", "image": "img", "host_ports": {"80/tcp": 8081}}
+        results = [
+            await health_monitor.register_container_to_discovery(info, "http://registry/", "key"),
+            await health_monitor.register_container_to_discovery(info, "http://registry/"),
+        ]
+        assert health_monitor.get_client() is client
+        await health_monitor.aclose_client()
+        assert client.is_closed and health_monitor._HTTPX_CLIENT is None
+        return results
+
+    assert asyncio.run(scenario()) == [True, True]
+    assert [p["url"] for p in posted] == ["http://registry/registry/endpoints"] * 2
+    assert [p["auth"] for p in posted] == ["Bearer key", None]
+    assert posted[0]["body"]["port"] == 8081
+
+
+def test_usage_fields_keep_cpu_when_memory_section_is_bad():
+    """A malformed memory section zeroes only the memory fields, and the reverse."""
+    cpu = {"cpu_usage": {"total_usage": 300, "percpu_usage": [1, 1]}, "system_cpu_usage": 1000}
+    precpu = {"cpu_usage": {"total_usage": 100}, "system_cpu_usage": 500}
+
+    assert _usage_fields({"cpu_stats": cpu, "precpu_stats": precpu, "memory_stats": "n/a"}) == \
+        (200.0, 500.0, 2, 0.0, 0.0)
+    assert _usage_fields({"cpu_stats": "n/a", "memory_stats": {"usage": 50, "limit": 200}}) == \
+        (0.0, 0.0, 1, 50.0, 200.0)
+
+
+def test_streams_back_off_while_docker_client_is_missing():
+    """With no Docker client the stats reader and event watcher exit instead of crashing."""
+    manager = FakeStatsManager()
+    manager.client = None
+    cache = StatsCache(manager)
+    cache.track(["c1"])
+    wait_until(lambda: not cache._readers, timeout=5)
+    assert manager.opened == []
+
+    inventory_manager = FakeInventoryManager([{"id": "a", "state": "running"}])
+    inventory = ContainerInventory(inventory_manager)
+    inventory_manager.client = None
+    assert [s["id"] for s in inventory.snapshot()] == ["a"]
+    inventory._watcher.join(timeout=5)
+    assert not inventory._watcher.is_alive()
+    assert inventory_manager.events_streams == []
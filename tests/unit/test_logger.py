@@ -0,0 +1,29 @@
+"""
+Unit tests for the shared logging setup.
+"""
+
+import logging
+from logging.handlers import QueueHandler
+
+from nvidia_orchestrator.utils.logger import configure_logger, get_logger
+
+
+def test_configure_logger_attaches_queue_handler_to_outside_loggers():
+    """A non-package logger gets one queue handler and stops propagating."""
+    app_logger = get_logger("unit-test-app")
+    configure_logger(app_logger)
+    configure_logger(app_logger)
+
+    assert [type(h) for h in app_logger.handlers] == [QueueHandler]
+    assert not app_logger.propagate
+    assert app_logger.level == logging.INFO
+
+
+def test_configure_logger_leaves_package_loggers_to_the_package_handler():
+    """Package child loggers already reach the queue handler through their parent."""
+    child = logging.getLogger("nvidia-orchestrator.unit-test")
+    configure_logger(child)
+
+    assert child.handlers == []
+    assert child.propagate
+    assert any(isinstance(h, QueueHandler) for h in logging.getLogger("nvidia-orchestrator").handlers)
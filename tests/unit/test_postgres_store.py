@@ -0,0 +1,119 @@
+"""
+Unit tests for PostgresStore's background write buffer, driven by a fake psycopg connection.
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Optional, Tuple
+
+import psycopg
+import pytest
+
+from nvidia_orchestrator.storage import postgres_store
+from nvidia_orchestrator.storage.postgres_store import PostgresStore
+
+
+class FakeDatabase:
+    """Committed desired-state rows plus the transactions that were attempted."""
+
+    def __init__(self) -> None:
+        self.rows: List[str] = []
+        self.transactions: List[List[str]] = []
+        self.gate = threading.Event()
+        self.gate.set()
+
+
+class FakeCursor:
+    def __init__(self, conn: "FakeConnection") -> None:
+        self._conn = conn
+
+    def __enter__(self) -> "FakeCursor":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        pass
+
+    def execute(self, sql: str, params: Optional[Tuple[Any, ...]] = None) -> None:
+        if params is None:  # schema setup
+            return
+        self._conn.db.gate.wait(timeout=10)
+        image = params[0]
+        if image.startswith("bad"):
+            raise psycopg.DataError(f"invalid row {image}")
+        self._conn.pending.append(image)
+        if self._conn.autocommit:
+            self._conn.db.rows.append(image)
+
+
+class FakeConnection:
+    """Autocommit connections write each statement; others commit on a clean exit."""
+
+    def __init__(self, db: FakeDatabase, autocommit: bool) -> None:
+        self.db = db
+        self.autocommit = autocommit
+        self.pending: List[str] = []
+
+    def __enter__(self) -> "FakeConnection":
+        return self
+
+    def __exit__(self, exc_type: Any, *exc: Any) -> None:
+        if not self.autocommit:
+            self.db.transactions.append(list(self.pending))
+            if exc_type is None:
+                self.db.rows.extend(self.pending)
+
+    def cursor(self, **kwargs: Any) -> FakeCursor:
+        return FakeCursor(self)
+
+    @contextmanager
+    def pipeline(self) -> Iterator[None]:
+        yield
+
+
+@pytest.fixture
+def db(monkeypatch: pytest.MonkeyPatch) -> FakeDatabase:
+    database = FakeDatabase()
+
+    def connect(dsn: str, autocommit: bool = False, **kwargs: Any) -> FakeConnection:
+        return FakeConnection(database, autocommit)
+
+    monkeypatch.setattr(postgres_store.psycopg, "connect", connect)
+    return database
+
+
+def _doc() -> dict:
+    return {"min_replicas": 1, "max_replicas": 2}
+
+
+def test_bad_row_rolls_back_batch_then_good_rows_commit_one_by_one(db: FakeDatabase):
+    """A batch with one bad upsert still commits the others through the per-operation retry."""
+    store = PostgresStore("postgresql://fake@db/orchestrator")
+    assert store.enabled
+
+    store._write_batch([
+        (postgres_store._OP_DESIRED, postgres_store._desired_params(image, _doc()))
+        for image in ("img-a", "bad-img", "img-b")
+    ])
+
+    assert db.transactions == [["img-a"]]  # the batch transaction stopped at the bad row
+    assert db.rows == ["img-a", "img-b"]
+
+
+def test_flush_blocks_until_queue_is_written(db: FakeDatabase):
+    """flush() returns only after the drainer has written every queued upsert."""
+    store = PostgresStore("postgresql://fake@db/orchestrator")
+    db.gate.clear()
+    for image in ("img-a", "img-b", "img-c"):
+        store.upsert_desired_async(image, _doc())
+
+    flusher = threading.Thread(target=store.flush)
+    flusher.start()
+    flusher.join(timeout=0.2)
+    assert flusher.is_alive()
+    assert db.rows == []
+
+    db.gate.set()
+    flusher.join(timeout=5)
+    assert not flusher.is_alive()
+    assert sorted(db.rows) == ["img-a", "img-b", "img-c"]
+    assert store._write_queue.unfinished_tasks == 0